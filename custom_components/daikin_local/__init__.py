@@ -3,11 +3,24 @@ import logging
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant, callback
 
-from .const import DOMAIN
+from .const import (
+    CONF_KEY,
+    CONF_PROTOCOL,
+    CONF_UUID,
+    DATA_FLEET,
+    DOMAIN,
+    PROTOCOL_HTTPS,
+)
+from .coordinator import DaikinCoordinator, async_remove_snapshot
 from .daikin_client import DaikinClient
+from .executor import async_get_executor, async_shutdown_executor
+from .fleet import FleetAggregator
+from .services import async_setup_services, async_unload_services
+from .view import async_register_view
+from .websocket_api import async_setup_websocket
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,35 +30,93 @@ PLATFORMS: list[Platform] = [Platform.CLIMATE, Platform.SENSOR, Platform.SWITCH]
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Daikin Local from a config entry."""
     hass.data.setdefault(DOMAIN, {})
-    
+
     # Create the Daikin client
     client = DaikinClient(
         ip_address=entry.data["ip_address"],
-        uuid=entry.data["uuid"],
-        key=entry.data["key"]
+        uuid=entry.data.get(CONF_UUID, ""),
+        key=entry.data.get(CONF_KEY, ""),
+        protocol=entry.data.get(CONF_PROTOCOL, PROTOCOL_HTTPS),
     )
-    
-    # Test the connection
-    try:
-        await hass.async_add_executor_job(client.test_connection)
+    coordinator = DaikinCoordinator(hass, client, entry, async_get_executor(hass))
+
+    # Entities start from the last known snapshot when there is one, so the
+    # first poll can wait for the unit's slot instead of blocking setup
+    if not await coordinator.async_load_snapshot():
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            # Setup is retried with a new client; release this one's resources,
+            # and the pool's if no other entry is using it
+            await hass.async_add_executor_job(client.close)
+            if not hass.data[DOMAIN]:
+                async_shutdown_executor(hass)
+            raise
         _LOGGER.info("Successfully connected to Daikin unit at %s", entry.data["ip_address"])
-    except Exception as err:
-        _LOGGER.error("Failed to connect to Daikin unit: %s", err)
-        return False
-    
-    # Store the client in hass data
-    hass.data[DOMAIN][entry.entry_id] = client
-    
+
+    # Store the coordinator in hass data
+    hass.data[DOMAIN][entry.entry_id] = coordinator
+
+    # Keep the unit's slot in the fleet aggregates current
+    fleet: FleetAggregator = hass.data.setdefault(DATA_FLEET, FleetAggregator())
+
+    @callback
+    def _async_update_fleet() -> None:
+        """Copy the unit's latest snapshot into the fleet arrays."""
+        fleet.update(
+            entry.entry_id,
+            coordinator.data if coordinator.last_update_success else None,
+        )
+
+    _async_update_fleet()
+    entry.async_on_unload(coordinator.async_add_listener(_async_update_fleet))
+
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    
+
+    async_setup_services(hass)
+    async_register_view(hass)
+    async_setup_websocket(hass)
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    async def _async_close_client(event: Event) -> None:
+        """Release the client's resources when Home Assistant stops."""
+        await hass.async_add_executor_job(client.close)
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close_client)
+    )
+
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
-    
+        # Shared state is updated before the first await, so entries unloaded
+        # concurrently see each other's removal
+        coordinator: DaikinCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        async_unload_services(hass)
+        fleet: FleetAggregator = hass.data[DATA_FLEET]
+        fleet.remove(entry.entry_id)
+        fleet.remove_sensor_platform(entry.entry_id)
+        if not hass.data[DOMAIN]:
+            async_shutdown_executor(hass)
+            hass.data.pop(DATA_FLEET)
+        # Ends telemetry streams before the client goes away
+        await coordinator.async_shutdown()
+        await hass.async_add_executor_job(coordinator.client.close)
+
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted snapshot of a deleted entry."""
+    await async_remove_snapshot(hass, entry.entry_id)
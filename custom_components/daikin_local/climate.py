@@ -11,20 +11,12 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
-    ATTR_CURRENT_HUMIDITY,
-    ATTR_CURRENT_TEMPERATURE,
-    ATTR_DEVICE_NAME,
     ATTR_ERROR_STATUS,
     ATTR_FAN_DIRECTION,
-    ATTR_FAN_SPEED,
-    ATTR_FIRMWARE_VERSION,
-    ATTR_HUMIDITY,
-    ATTR_MODE,
-    ATTR_POWER,
     ATTR_TEMPERATURE,
     CLIMATE_MODE_AUTO,
     CLIMATE_MODE_COOL,
@@ -47,7 +39,8 @@ from .const import (
     MIN_TEMP,
     TEMP_STEP,
 )
-from .daikin_client import DaikinClient
+from .coordinator import DaikinCoordinator
+from .entity import DaikinEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -58,12 +51,12 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Daikin Local climate based on a config entry."""
-    client: DaikinClient = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: DaikinCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     
-    async_add_entities([DaikinClimateEntity(client, config_entry)])
+    async_add_entities([DaikinClimateEntity(coordinator)])
 
 
-class DaikinClimateEntity(ClimateEntity):
+class DaikinClimateEntity(DaikinEntity, ClimateEntity):
     """Representation of a Daikin climate entity."""
 
     _attr_hvac_modes = [
@@ -84,6 +77,9 @@ class DaikinClimateEntity(ClimateEntity):
         FAN_SPEED_MAX,
     ]
     
+    # Both are exposed as their own entities, so there is no need to record them here
+    _unrecorded_attributes = frozenset({ATTR_FAN_DIRECTION, ATTR_ERROR_STATUS})
+
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_target_temperature_step = TEMP_STEP
     _attr_min_temp = MIN_TEMP
@@ -95,12 +91,10 @@ class DaikinClimateEntity(ClimateEntity):
         | ClimateEntityFeature.TURN_ON
     )
 
-    def __init__(self, client: DaikinClient, config_entry: ConfigEntry) -> None:
+    def __init__(self, coordinator: DaikinCoordinator) -> None:
         """Initialize the climate entity."""
-        self._client = client
-        self._config_entry = config_entry
-        self._attr_unique_id = f"{config_entry.entry_id}_climate"
-        self._attr_name = config_entry.data.get("name", "Daikin AC")
+        super().__init__(coordinator, "climate")
+        self._attr_name = self._config_entry.data.get("name", "Daikin AC")
         
         # Initialize state attributes
         self._attr_current_temperature = None
@@ -111,27 +105,21 @@ class DaikinClimateEntity(ClimateEntity):
         self._attr_fan_direction = "0"
         self._attr_power = False
         self._attr_error_status = "0"
-        self._attr_device_name = None
-        self._attr_firmware_version = None
+        self._update_from_snapshot()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the climate entity state from the coordinator snapshot."""
+        self._update_from_snapshot()
+        super()._handle_coordinator_update()
 
-    async def async_update(self) -> None:
+    def _update_from_snapshot(self) -> None:
         """Update the climate entity state."""
+        control_info = self.control_info
+        sensor_info = self.sensor_info
+        basic_info = self.basic_info
+
         try:
-            # Get control info
-            control_info = await self.hass.async_add_executor_job(
-                self._client.get_control_info
-            )
-            
-            # Get sensor info
-            sensor_info = await self.hass.async_add_executor_job(
-                self._client.get_sensor_info
-            )
-            
-            # Get basic info (for device info)
-            basic_info = await self.hass.async_add_executor_job(
-                self._client.get_basic_info
-            )
-            
             # Update control attributes
             if "pow" in control_info:
                 self._attr_power = control_info["pow"] == "1"
@@ -156,18 +144,11 @@ class DaikinClimateEntity(ClimateEntity):
             if "hhum" in sensor_info:
                 self._attr_current_humidity = float(sensor_info["hhum"])
             
-            # Update device info
-            if "name" in basic_info:
-                self._attr_device_name = basic_info["name"]
-            
-            if "ver" in basic_info:
-                self._attr_firmware_version = basic_info["ver"]
-            
             if "err" in basic_info:
                 self._attr_error_status = basic_info["err"]
             
-        except Exception as err:
-            _LOGGER.error("Failed to update climate entity: %s", err)
+        except ValueError as err:
+            _LOGGER.error("Failed to parse climate state: %s", err)
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -175,104 +156,30 @@ class DaikinClimateEntity(ClimateEntity):
         if temperature is None:
             return
         
-        # Get current control info to preserve other settings
-        control_info = await self.hass.async_add_executor_job(
-            self._client.get_control_info
-        )
-        
-        # Set new temperature
-        success = await self.hass.async_add_executor_job(
-            lambda: self._client.set_control_info(
-                pow=control_info.get("pow", "1"),
-                mode=control_info.get("mode", "1"),
-                stemp=str(temperature),
-                shum=control_info.get("shum", "0"),
-                f_rate=control_info.get("f_rate", "A"),
-                f_dir=control_info.get("f_dir", "0")
-            )
-        )
-        
-        if success:
-            self._attr_target_temperature = temperature
-            self.async_write_ha_state()
+        # Other settings are preserved by the coordinator's read-modify-write
+        await self.coordinator.async_update_control(stemp=str(temperature))
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
         if hvac_mode == HVACMode.OFF:
-            # Turn off - need to preserve all parameters
-            control_info = await self.hass.async_add_executor_job(
-                self._client.get_control_info
-            )
-            
-            success = await self.hass.async_add_executor_job(
-                lambda: self._client.set_control_info(
-                    pow="0",
-                    mode=control_info.get("mode", "0"),
-                    stemp=control_info.get("stemp", "22.0"),
-                    shum=control_info.get("shum", "0"),
-                    f_rate=control_info.get("f_rate", "A"),
-                    f_dir=control_info.get("f_dir", "0")
-                )
-            )
+            await self.coordinator.async_update_control(pow="0")
         else:
             # Turn on with specific mode
             daikin_mode = HA_MODE_TO_DAIKIN.get(hvac_mode, "1")
-            
-            # Get current settings
-            control_info = await self.hass.async_add_executor_job(
-                self._client.get_control_info
-            )
-            
-            success = await self.hass.async_add_executor_job(
-                lambda: self._client.set_control_info(
-                    pow="1",
-                    mode=daikin_mode,
-                    stemp=control_info.get("stemp", "22.0"),
-                    shum=control_info.get("shum", "0"),
-                    f_rate=control_info.get("f_rate", "A"),
-                    f_dir=control_info.get("f_dir", "0")
-                )
-            )
-        
-        if success:
-            self._attr_hvac_mode = hvac_mode
-            self._attr_power = hvac_mode != HVACMode.OFF
-            self.async_write_ha_state()
+            await self.coordinator.async_update_control(pow="1", mode=str(daikin_mode))
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new target fan mode."""
         daikin_fan = HA_FAN_TO_DAIKIN.get(fan_mode, "A")
-        
-        # Get current control info
-        control_info = await self.hass.async_add_executor_job(
-            self._client.get_control_info
-        )
-        
-        success = await self.hass.async_add_executor_job(
-            lambda: self._client.set_control_info(
-                pow=control_info.get("pow", "1"),
-                mode=control_info.get("mode", "1"),
-                stemp=control_info.get("stemp", "22.0"),
-                shum=control_info.get("shum", "0"),
-                f_rate=daikin_fan,
-                f_dir=control_info.get("f_dir", "0")
-            )
-        )
-        
-        if success:
-            self._attr_fan_mode = fan_mode
-            self.async_write_ha_state()
+        await self.coordinator.async_update_control(f_rate=daikin_fan)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
+        # Power, mode, fan speed and humidity are already part of the climate
+        # state, and the device name and firmware live in the device registry
         return {
-            ATTR_POWER: self._attr_power,
-            ATTR_MODE: self._attr_hvac_mode,
-            ATTR_FAN_SPEED: self._attr_fan_mode,
+            **(super().extra_state_attributes or {}),
             ATTR_FAN_DIRECTION: self._attr_fan_direction,
-            ATTR_CURRENT_HUMIDITY: self._attr_current_humidity,
             ATTR_ERROR_STATUS: self._attr_error_status,
-            ATTR_DEVICE_NAME: self._attr_device_name,
-            ATTR_FIRMWARE_VERSION: self._attr_firmware_version,
         }
@@ -1,59 +1,184 @@
 """Config flow for Daikin Local integration."""
 from __future__ import annotations
 
+import asyncio
+import ipaddress
 import logging
 from typing import Any
 
 import voluptuous as vol
+import yaml
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.selector import TextSelector, TextSelectorConfig
 
-from .const import CONF_IP_ADDRESS, CONF_KEY, CONF_UUID, DOMAIN
+from .const import (
+    BULK_IMPORT_CONCURRENCY,
+    CONF_HUMIDITY_DEADBAND,
+    CONF_IP_ADDRESS,
+    CONF_KEY,
+    CONF_MAX_PUBLISH_INTERVAL,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_PROTOCOL,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_UUID,
+    DEFAULT_HUMIDITY_DEADBAND,
+    DEFAULT_MAX_PUBLISH_INTERVAL,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DOMAIN,
+    PROTOCOL_DETECT_TIMEOUT,
+    PROTOCOL_HTTP,
+    PROTOCOL_HTTPS,
+)
 from .daikin_client import DaikinClient
+from .discovery import DiscoveredUnit, async_discover_units
 
 _LOGGER = logging.getLogger(__name__)
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_IP_ADDRESS): str,
-        vol.Required(CONF_UUID): str,
-        vol.Required(CONF_KEY): str,
+        vol.Optional(CONF_UUID, default=""): str,
+        vol.Optional(CONF_KEY, default=""): str,
         vol.Optional(CONF_NAME, default="Daikin AC"): str,
     }
 )
 
+MANUAL_ENTRY = "manual"
+BULK_IMPORT = "bulk"
+CONF_UNITS = "units"
 
-async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
-    """Validate the user input allows us to connect."""
-    
-    client = DaikinClient(
-        ip_address=data[CONF_IP_ADDRESS],
-        uuid=data[CONF_UUID],
-        key=data[CONF_KEY]
-    )
-    
-    # Test connection
-    if not await hass.async_add_executor_job(client.test_connection):
-        raise CannotConnect
-    
-    # Get basic info to verify the connection
+
+def _ip_address(value: Any) -> str:
+    """Validate an IPv4 or IPv6 address."""
     try:
-        basic_info = await hass.async_add_executor_job(client.get_basic_info)
-        if "ret" not in basic_info or basic_info["ret"] != "OK":
-            raise CannotConnect
-    except Exception as err:
-        _LOGGER.error("Failed to get basic info: %s", err)
-        raise CannotConnect
-    
-    # Return info that will be stored in the config entry
-    return {
-        "title": data.get(CONF_NAME, "Daikin AC"),
-        "device_info": basic_info
+        return str(ipaddress.ip_address(str(value).strip()))
+    except ValueError as err:
+        raise vol.Invalid(f"invalid IP address {value!r}") from err
+
+
+# Imported units are not reviewed one by one, so the address is checked and
+# the name defaults to it instead of a name every unit would share
+BULK_UNIT_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_IP_ADDRESS): _ip_address,
+        vol.Optional(CONF_UUID, default=""): str,
+        vol.Optional(CONF_KEY, default=""): str,
+        vol.Optional(CONF_NAME, default=""): str,
     }
+)
+
+
+def _user_schema(ip_address: str = "", name: str = "Daikin AC") -> vol.Schema:
+    """Return the user step schema pre-filled with discovered values."""
+    if not ip_address:
+        return STEP_USER_DATA_SCHEMA
+    return vol.Schema(
+        {
+            vol.Required(CONF_IP_ADDRESS, default=ip_address): str,
+            vol.Optional(CONF_UUID, default=""): str,
+            vol.Optional(CONF_KEY, default=""): str,
+            vol.Optional(CONF_NAME, default=name): str,
+        }
+    )
+
+
+def _parse_units(text: str) -> tuple[list[dict[str, Any]], list[str]]:
+    """Parse a YAML list of units or IP[,UUID,KEY[,NAME]] lines.
+
+    Returns the units and a description of every entry that could not be read.
+    Raises InvalidUnits for YAML that is neither a list nor plain lines.
+    """
+    try:
+        # BaseLoader keeps every scalar a string, so keys keep leading zeros
+        node = yaml.compose(text, Loader=yaml.BaseLoader)
+    except yaml.YAMLError:
+        node = None
+
+    if isinstance(node, yaml.SequenceNode):
+        entries = yaml.load(text, Loader=yaml.BaseLoader)
+    elif isinstance(node, yaml.MappingNode) or (
+        isinstance(node, yaml.ScalarNode) and node.style is not None
+    ):
+        # Only plain, unquoted text can be the line format
+        raise InvalidUnits
+    else:
+        entries = []
+        for line in text.splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            parts = [part.strip() for part in line.split(",")]
+            entries.append(
+                dict(zip((CONF_IP_ADDRESS, CONF_UUID, CONF_KEY, CONF_NAME), parts))
+                if len(parts) in (1, 3, 4)
+                else line
+            )
+
+    units: list[dict[str, Any]] = []
+    invalid: list[str] = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            invalid.append(f"{entry}: expected ip_address and optional uuid, key and name")
+            continue
+        if not all(isinstance(value, str) for value in entry.values()):
+            invalid.append(f"{entry}: values must be plain strings, not lists or mappings")
+            continue
+        try:
+            unit = BULK_UNIT_SCHEMA(entry)
+        except vol.Invalid as err:
+            invalid.append(f"{entry}: {err}")
+            continue
+        unit[CONF_NAME] = unit[CONF_NAME] or unit[CONF_IP_ADDRESS]
+        units.append(unit)
+    return units, invalid
+
+
+async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
+    """Validate the user input allows us to connect and detect the protocol.
+
+    Units without a uuid and key are tried on plain HTTP first, falling back
+    to HTTPS; keyed units use HTTPS.
+    """
+    if data.get(CONF_KEY):
+        protocols = (PROTOCOL_HTTPS,)
+    else:
+        protocols = (PROTOCOL_HTTP, PROTOCOL_HTTPS)
+
+    for index, protocol in enumerate(protocols):
+        client = DaikinClient(
+            ip_address=data[CONF_IP_ADDRESS],
+            uuid=data.get(CONF_UUID, ""),
+            key=data.get(CONF_KEY, ""),
+            protocol=protocol,
+        )
+        # Only a fallback protocol gets the full budget
+        timeout = PROTOCOL_DETECT_TIMEOUT if index < len(protocols) - 1 else None
+        try:
+            basic_info = await hass.async_add_executor_job(client.get_basic_info, timeout)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("No answer over %s from %s: %s", protocol, data[CONF_IP_ADDRESS], err)
+            continue
+        finally:
+            # Every attempt creates a client; release its resources either way
+            await hass.async_add_executor_job(client.close)
+
+        if basic_info.get("ret") == "OK":
+            # Return info that will be stored in the config entry
+            return {
+                "title": data.get(CONF_NAME, "Daikin AC"),
+                "device_info": basic_info,
+                CONF_PROTOCOL: protocol,
+            }
+        _LOGGER.debug("Unexpected %s answer from %s: %s", protocol, data[CONF_IP_ADDRESS], basic_info)
+
+    _LOGGER.error("Failed to get basic info from %s", data[CONF_IP_ADDRESS])
+    raise CannotConnect
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -61,12 +186,38 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._discovered: dict[str, DiscoveredUnit] | None = None
+        self._selected: DiscoveredUnit | None = None
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
         errors: dict[str, str] = {}
-        
+
+        if user_input is None and self._discovered is None:
+            configured = {
+                entry.data.get(CONF_IP_ADDRESS)
+                for entry in self._async_current_entries()
+            }
+            units = await async_discover_units(self.hass)
+            self._discovered = {
+                unit.ip_address: unit
+                for unit in units
+                if unit.ip_address not in configured
+            }
+            return await self.async_step_pick_device()
+
         if user_input is not None:
             try:
                 info = await validate_input(self.hass, user_input)
@@ -78,15 +229,208 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             else:
                 return self.async_create_entry(
                     title=info["title"],
-                    data=user_input,
+                    data={**user_input, CONF_PROTOCOL: info[CONF_PROTOCOL]},
                 )
 
+        selected = self._selected
         return self.async_show_form(
             step_id="user",
-            data_schema=STEP_USER_DATA_SCHEMA,
+            data_schema=_user_schema(
+                selected.ip_address if selected else "",
+                selected.name if selected else "Daikin AC",
+            ),
             errors=errors,
         )
 
+    async def async_step_pick_device(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Let the user pick one of the discovered units."""
+        assert self._discovered is not None
+
+        if user_input is not None:
+            if user_input[CONF_IP_ADDRESS] == BULK_IMPORT:
+                return await self.async_step_bulk()
+            self._selected = self._discovered.get(user_input[CONF_IP_ADDRESS])
+            return await self.async_step_user()
+
+        choices = {ip: unit.label for ip, unit in self._discovered.items()}
+        choices[MANUAL_ENTRY] = "Enter details manually"
+        choices[BULK_IMPORT] = "Import a list of units"
+        return self.async_show_form(
+            step_id="pick_device",
+            data_schema=vol.Schema(
+                {vol.Required(CONF_IP_ADDRESS): vol.In(choices)}
+            ),
+        )
+
+    async def async_step_bulk(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Validate a pasted list of units in parallel and add all that connect."""
+        errors: dict[str, str] = {}
+        failures: list[str] = []
+        text = ""
+
+        if user_input is not None:
+            text = user_input[CONF_UNITS]
+            try:
+                units, failures = _parse_units(text)
+            except InvalidUnits:
+                errors["base"] = "invalid_units"
+                return self._async_show_bulk_form(text, errors, failures)
+            configured = {
+                entry.data.get(CONF_IP_ADDRESS)
+                for entry in self._async_current_entries()
+            }
+            pending: dict[str, dict[str, Any]] = {}
+            for unit in units:
+                ip_address = unit[CONF_IP_ADDRESS]
+                if ip_address in configured or ip_address in pending:
+                    failures.append(f"{ip_address}: already configured")
+                else:
+                    pending[ip_address] = unit
+
+            semaphore = asyncio.Semaphore(BULK_IMPORT_CONCURRENCY)
+
+            async def validate(unit: dict[str, Any]) -> str | None:
+                async with semaphore:
+                    try:
+                        info = await validate_input(self.hass, unit)
+                    except CannotConnect:
+                        return "cannot connect"
+                    except Exception as err:  # pylint: disable=broad-except
+                        _LOGGER.exception("Unexpected exception validating %s", unit)
+                        return str(err) or type(err).__name__
+                unit[CONF_PROTOCOL] = info[CONF_PROTOCOL]
+                return None
+
+            results = await asyncio.gather(
+                *(validate(unit) for unit in pending.values())
+            )
+            passed = []
+            retry_lines = []
+            for unit, error in zip(pending.values(), results):
+                if error is None:
+                    passed.append(unit)
+                else:
+                    failures.append(f"{unit[CONF_IP_ADDRESS]}: {error}")
+                    retry_lines.append(
+                        ",".join(
+                            unit[key] for key in (CONF_IP_ADDRESS, CONF_UUID, CONF_KEY, CONF_NAME)
+                        )
+                    )
+
+            # Each unit becomes its own entry through the import step
+            for unit in passed:
+                self.hass.async_create_task(
+                    self.hass.config_entries.flow.async_init(
+                        DOMAIN,
+                        context={"source": config_entries.SOURCE_IMPORT},
+                        data=unit,
+                    )
+                )
+
+            if not failures:
+                return self.async_abort(
+                    reason="bulk_imported",
+                    description_placeholders={"count": str(len(passed))},
+                )
+            errors["base"] = "bulk_failed" if passed or units else "no_units"
+            if retry_lines:
+                text = "\n".join(retry_lines)
+            _LOGGER.warning(
+                "Bulk import added %d unit(s), %d failed: %s",
+                len(passed),
+                len(failures),
+                "; ".join(failures),
+            )
+
+        return self._async_show_bulk_form(text, errors, failures)
+
+    @callback
+    def _async_show_bulk_form(
+        self, text: str, errors: dict[str, str], failures: list[str]
+    ) -> FlowResult:
+        """Show the bulk import form with the text to fix and every failure."""
+        return self.async_show_form(
+            step_id="bulk",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_UNITS, default=text): TextSelector(
+                        TextSelectorConfig(multiline=True)
+                    )
+                }
+            ),
+            errors=errors,
+            description_placeholders={
+                "failures": "\n".join(f"- {failure}" for failure in failures)
+            },
+        )
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> FlowResult:
+        """Create an entry for a unit already validated by the bulk import step."""
+        for entry in self._async_current_entries():
+            if entry.data.get(CONF_IP_ADDRESS) == import_data[CONF_IP_ADDRESS]:
+                return self.async_abort(reason="already_configured")
+        return self.async_create_entry(
+            title=import_data.get(CONF_NAME) or import_data[CONF_IP_ADDRESS],
+            data=import_data,
+        )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Daikin Local options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow for an entry."""
+        # Home Assistant only sets config_entry on options flows from 2024.11
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the sensor publishing options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_TEMPERATURE_DEADBAND,
+                        default=options.get(
+                            CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=5)),
+                    vol.Optional(
+                        CONF_HUMIDITY_DEADBAND,
+                        default=options.get(
+                            CONF_HUMIDITY_DEADBAND, DEFAULT_HUMIDITY_DEADBAND
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=20)),
+                    vol.Optional(
+                        CONF_MIN_PUBLISH_INTERVAL,
+                        default=options.get(
+                            CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                    vol.Optional(
+                        CONF_MAX_PUBLISH_INTERVAL,
+                        default=options.get(
+                            CONF_MAX_PUBLISH_INTERVAL, DEFAULT_MAX_PUBLISH_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=60, max=86400)),
+                }
+            ),
+        )
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
+
+
+class InvalidUnits(HomeAssistantError):
+    """Error to indicate the pasted units are neither a YAML list nor lines."""
@@ -6,10 +6,59 @@ DOMAIN = "daikin_local"
 CONF_IP_ADDRESS = "ip_address"
 CONF_UUID = "uuid"
 CONF_KEY = "key"
+CONF_PROTOCOL = "protocol"
+
+# Protocols; entries created before detection existed use HTTPS
+PROTOCOL_HTTP = "http"
+PROTOCOL_HTTPS = "https"
 
 # Default values
 DEFAULT_PORT = 443
+HTTP_PORT = 80
 DEFAULT_TIMEOUT = 10
+DEFAULT_SCAN_INTERVAL = 30
+
+# Random offset added once at startup to a unit's poll slot
+STARTUP_JITTER = 5
+
+# Overall time budgets, covering every attempt and fallback of a call
+DEFAULT_REQUEST_TIMEOUT = 15
+POLL_TIMEOUT = 20
+CONTROL_TIMEOUT = 15
+
+# Set once the read-only snapshot view is registered
+DATA_VIEW = f"{DOMAIN}_view"
+
+# Live telemetry polled while websocket subscribers are attached
+DATA_WEBSOCKET = f"{DOMAIN}_websocket"
+TELEMETRY_INTERVAL = 2
+TELEMETRY_TIMEOUT = 5
+
+# Dedicated thread pool for blocking unit I/O, shared by all entries
+DATA_EXECUTOR = f"{DOMAIN}_executor"
+EXECUTOR_WORKERS = 4
+# Background polls are rejected once this many jobs wait for a worker
+EXECUTOR_MAX_QUEUE = 8
+
+# Cached control info younger than this is trusted to skip no-op writes; kept
+# short because the unit can be changed with its IR remote at any time
+CONTROL_SNAPSHOT_MAX_AGE = 5
+
+# Seconds a control change that could not be sent is kept for replay
+INTENT_TTL = 900
+
+# Consecutive failed polls before a unit's entities become unavailable
+FAILURE_THRESHOLD = 3
+# Seconds between repeated warnings while a unit stays unreachable
+UNAVAILABLE_LOG_INTERVAL = 900
+
+# Number of TLS sessions kept for resumption across all units
+TLS_SESSION_CACHE_SIZE = 64
+
+# Idle keep-alive connections kept per plain-HTTP unit
+HTTP_POOL_SIZE = 2
+# Budget for each protocol tried while detecting a unit's protocol
+PROTOCOL_DETECT_TIMEOUT = 5
 
 # API endpoints
 ENDPOINT_BASIC_INFO = "/common/basic_info"
@@ -18,6 +67,34 @@ ENDPOINT_SENSOR_INFO = "/aircon/get_sensor_info"
 ENDPOINT_SET_CONTROL = "/aircon/set_control_info"
 ENDPOINT_REGISTER_TERMINAL = "/common/register_terminal"
 
+# Snapshot sections, one per polled endpoint
+SNAPSHOT_BASIC_INFO = "basic_info"
+SNAPSHOT_CONTROL_INFO = "control_info"
+SNAPSHOT_SENSOR_INFO = "sensor_info"
+
+# Thermal model: RLS forgetting factor per poll, polls before predictions are
+# published, and the longest gap in seconds between polls that is still fitted
+THERMAL_FORGETTING = 0.999
+THERMAL_MIN_SAMPLES = 60
+THERMAL_MAX_GAP = 300
+
+# Polls kept per reading for the rolling statistics sensors (10 minutes)
+RING_BUFFER_SIZE = 20
+
+# Fleet-wide aggregates across all units, shared by all entries
+DATA_FLEET = f"{DOMAIN}_fleet"
+FLEET_INITIAL_CAPACITY = 8
+# Rough electrical estimate: watts per compressor Hz plus the indoor fan of a running unit
+ESTIMATED_WATTS_PER_HZ = 25
+ESTIMATED_FAN_WATTS = 30
+
+# Snapshot persistence
+STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 60
+
+# Parameters accepted by set_control_info
+CONTROL_PARAMS = ("pow", "mode", "stemp", "shum", "f_rate", "f_dir")
+
 # Climate modes
 CLIMATE_MODE_OFF = "off"
 CLIMATE_MODE_AUTO = "auto"
@@ -74,3 +151,38 @@ ATTR_CURRENT_HUMIDITY = "current_humidity"
 ATTR_ERROR_STATUS = "error_status"
 ATTR_DEVICE_NAME = "device_name"
 ATTR_FIRMWARE_VERSION = "firmware_version"
+ATTR_STALE = "stale"
+
+# Units validated in parallel by the bulk import step
+BULK_IMPORT_CONCURRENCY = 8
+
+# Discovery
+DISCOVERY_UDP_PORT = 30050
+DISCOVERY_UDP_SRC_PORT = 30000
+DISCOVERY_MESSAGE = b"DAIKIN_UDP/common/basic_info"
+DISCOVERY_TIMEOUT = 2.0
+DISCOVERY_CONNECT_TIMEOUT = 0.5
+DISCOVERY_FINGERPRINT_TIMEOUT = 3
+DISCOVERY_SWEEP_CONCURRENCY = 64
+
+# Services
+SERVICE_SET_GROUP = "set_group"
+ATTR_HVAC_MODE = "hvac_mode"
+ATTR_FAN_MODE = "fan_mode"
+ATTR_SWING = "swing"
+ATTR_FORCE = "force"
+GROUP_CONCURRENCY = 10
+SERVICE_PROFILE = "profile"
+ATTR_DURATION = "duration"
+DEFAULT_PROFILE_DURATION = 60
+MAX_PROFILE_DURATION = 3600
+
+# Sensor publishing options
+CONF_TEMPERATURE_DEADBAND = "temperature_deadband"
+CONF_HUMIDITY_DEADBAND = "humidity_deadband"
+CONF_MIN_PUBLISH_INTERVAL = "min_publish_interval"
+CONF_MAX_PUBLISH_INTERVAL = "max_publish_interval"
+DEFAULT_TEMPERATURE_DEADBAND = 0.0
+DEFAULT_HUMIDITY_DEADBAND = 0.0
+DEFAULT_MIN_PUBLISH_INTERVAL = 0
+DEFAULT_MAX_PUBLISH_INTERVAL = 900
@@ -0,0 +1,426 @@
+"""Data update coordinator for the Daikin Local integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import timedelta
+import hashlib
+import logging
+import random
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONTROL_TIMEOUT,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    FAILURE_THRESHOLD,
+    INTENT_TTL,
+    POLL_TIMEOUT,
+    RING_BUFFER_SIZE,
+    SNAPSHOT_CONTROL_INFO,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_SENSOR_INFO,
+    STARTUP_JITTER,
+    STORAGE_VERSION,
+    TELEMETRY_INTERVAL,
+    TELEMETRY_TIMEOUT,
+    UNAVAILABLE_LOG_INTERVAL,
+)
+from .daikin_client import DaikinClient
+from .executor import DaikinExecutor, ExecutorSaturated
+from .ring_buffer import ReadingBuffers
+from .thermal import ThermalModel
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding the last known snapshot of a unit."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
+async def async_remove_snapshot(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the persisted snapshot of a unit."""
+    await _snapshot_store(hass, entry_id).async_remove()
+
+
+def find_coordinator(hass: HomeAssistant, unit: str) -> DaikinCoordinator | None:
+    """Return the coordinator of a unit given its entry id or IP address."""
+    coordinators: dict[str, DaikinCoordinator] = hass.data.get(DOMAIN, {})
+    if unit in coordinators:
+        return coordinators[unit]
+    for coordinator in coordinators.values():
+        if coordinator.client.ip_address == unit:
+            return coordinator
+    return None
+
+
+def poll_phase(entry_id: str, interval: float) -> float:
+    """Return a stable offset within the interval for a unit's polls."""
+    digest = hashlib.sha1(entry_id.encode()).digest()
+    return int.from_bytes(digest[:8], "big") % int(interval * 1000) / 1000
+
+
+class DaikinCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
+    """Poll one Daikin unit and share its snapshot with all entities."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: DaikinClient,
+        entry: ConfigEntry,
+        executor: DaikinExecutor,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} {client.ip_address}",
+            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        )
+        self.client = client
+        self.entry = entry
+        self.executor = executor
+        self.stale = False
+        self.last_updated = None
+        self.consecutive_failures = 0
+        self.poll_phase = poll_phase(entry.entry_id, DEFAULT_SCAN_INTERVAL)
+        # Offset of this unit's polls on the event loop clock, jittered once at startup
+        self._poll_slot = self.poll_phase + random.uniform(0, STARTUP_JITTER)
+        self.thermal = ThermalModel()
+        self.readings = ReadingBuffers(RING_BUFFER_SIZE)
+        # Control fields that could not be written: param -> (value, monotonic time)
+        self.desired: dict[str, tuple[str, float]] = {}
+        self._reconciling = False
+        # The unit serves one request at a time: polls, telemetry samples and
+        # writes take turns instead of overlapping on its connection
+        self._io_lock = asyncio.Lock()
+        # Telemetry subscribers as (listener, ended) pairs
+        self._telemetry_listeners: list[
+            tuple[Callable[[dict[str, Any]], None], Callable[[], None]]
+        ] = []
+        self._telemetry_task: asyncio.Task | None = None
+        # Latest telemetry sample while the loop runs, diffs are taken against it
+        self.telemetry: dict[str, dict[str, Any]] | None = None
+        self._last_unavailable_log = 0.0
+        self._store = _snapshot_store(hass, entry.entry_id)
+        self._save_pending = False
+        # The first scheduled poll waits for the unit's slot, however soon it is
+        self.update_interval = timedelta(seconds=self._seconds_to_slot())
+
+    async def async_load_snapshot(self) -> bool:
+        """Load the last known snapshot, marking it stale until refreshed."""
+        cached = await self._store.async_load()
+        if not cached or not cached.get("snapshot"):
+            return False
+
+        self.data = cached["snapshot"]
+        self.thermal.restore(cached.get("thermal", {}))
+        self.last_updated = dt_util.parse_datetime(cached.get("updated", ""))
+        self.stale = True
+        _LOGGER.debug(
+            "Restored snapshot for %s from %s", self.client.ip_address, self.last_updated
+        )
+        return True
+
+    def _seconds_to_slot(self) -> float:
+        """Return the time until this unit's next slot in the scan interval."""
+        return (self._poll_slot - self.hass.loop.time()) % DEFAULT_SCAN_INTERVAL
+
+    @callback
+    def _async_align_next_poll(self) -> None:
+        """Time the base class' next tick to land on this unit's slot.
+
+        The base class schedules each tick one update_interval after the
+        previous refresh, so a fixed interval would let every poll's duration
+        push the slot later. A slot less than half an interval away is
+        skipped, so a refresh just before it is not followed by another one.
+        """
+        wait = self._seconds_to_slot()
+        if wait < DEFAULT_SCAN_INTERVAL / 2:
+            wait += DEFAULT_SCAN_INTERVAL
+        self.update_interval = timedelta(seconds=wait)
+
+    @callback
+    def async_add_telemetry_listener(
+        self,
+        listener: Callable[[dict[str, Any]], None],
+        ended: Callable[[], None],
+    ) -> Callable[[], None]:
+        """Stream telemetry diffs to a listener, polling fast while any is attached.
+
+        The listener first gets the full control and sensor info of the latest
+        telemetry sample, or of the snapshot if no loop is running yet, then
+        only the fields that changed. Samples are not written to the snapshot,
+        so they cause no state or recorder writes. ended is called if the
+        stream stops because the coordinator shuts down.
+        """
+        subscriber = (listener, ended)
+        self._telemetry_listeners.append(subscriber)
+        if self.telemetry is None:
+            data = self.data or {}
+            self.telemetry = {
+                SNAPSHOT_CONTROL_INFO: dict(data.get(SNAPSHOT_CONTROL_INFO, {})),
+                SNAPSHOT_SENSOR_INFO: dict(data.get(SNAPSHOT_SENSOR_INFO, {})),
+            }
+        listener({section: dict(values) for section, values in self.telemetry.items()})
+        if self._telemetry_task is None:
+            self._telemetry_task = self.hass.async_create_background_task(
+                self._async_telemetry_loop(), f"{self.name} telemetry"
+            )
+
+        @callback
+        def remove_listener() -> None:
+            if subscriber not in self._telemetry_listeners:
+                return
+            self._telemetry_listeners.remove(subscriber)
+            if not self._telemetry_listeners:
+                self._async_stop_telemetry()
+
+        return remove_listener
+
+    @callback
+    def _async_stop_telemetry(self) -> None:
+        """Cancel the telemetry loop and forget its latest sample."""
+        if self._telemetry_task is not None:
+            self._telemetry_task.cancel()
+            self._telemetry_task = None
+        self.telemetry = None
+
+    async def _async_telemetry_loop(self) -> None:
+        """Poll control and sensor info every TELEMETRY_INTERVAL and send diffs."""
+        loop = asyncio.get_running_loop()
+        while self._telemetry_listeners and self.telemetry is not None:
+            started = loop.time()
+            try:
+                async with self._io_lock:
+                    sample = await self.executor.async_run(
+                        self.client.get_telemetry, TELEMETRY_TIMEOUT, background=True
+                    )
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug("Telemetry poll of %s failed: %s", self.client.ip_address, err)
+            else:
+                diff = {}
+                for section, values in sample.items():
+                    latest = self.telemetry[section]
+                    changed = {
+                        key: value
+                        for key, value in values.items()
+                        if latest.get(key) != value
+                    }
+                    if changed:
+                        diff[section] = changed
+                        latest.update(changed)
+                if diff:
+                    for listener, _ in list(self._telemetry_listeners):
+                        listener(diff)
+            await asyncio.sleep(max(0.0, TELEMETRY_INTERVAL - (loop.time() - started)))
+
+    async def async_shutdown(self) -> None:
+        """Stop the telemetry loop along with the coordinator, ending every stream."""
+        subscribers, self._telemetry_listeners = self._telemetry_listeners, []
+        self._async_stop_telemetry()
+        for _, ended in subscribers:
+            ended()
+        if self._save_pending:
+            # Write now: the debounced save would keep this coordinator alive
+            self._save_pending = False
+            await self._store.async_save(self._data_to_save())
+        await super().async_shutdown()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the snapshot in its stored form."""
+        return {
+            "snapshot": self.data,
+            "updated": self.last_updated.isoformat() if self.last_updated else None,
+            "thermal": self.thermal.as_dict(),
+        }
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule a debounced write of the snapshot."""
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_write, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _data_to_write(self) -> dict[str, Any]:
+        """Return the snapshot for the debounced write, which is no longer pending."""
+        self._save_pending = False
+        return self._data_to_save()
+
+    async def _async_update_data(self) -> dict[str, dict[str, Any]]:
+        """Fetch a fresh snapshot, then move the next poll to the unit's slot."""
+        try:
+            return await self._async_poll()
+        finally:
+            self._async_align_next_poll()
+
+    async def _async_poll(self) -> dict[str, dict[str, Any]]:
+        """Fetch a fresh snapshot from the unit."""
+        try:
+            async with self._io_lock:
+                snapshot = await self.executor.async_run(
+                    self.client.get_snapshot, POLL_TIMEOUT, background=True
+                )
+        except ExecutorSaturated as err:
+            # Not the unit's fault: skip this poll rather than count a failure
+            if self.data is None:
+                raise UpdateFailed(
+                    f"Poll of {self.client.ip_address} rejected: {err}"
+                ) from err
+            _LOGGER.debug("Skipping poll of %s: %s", self.client.ip_address, err)
+            return self.data
+        except Exception as err:
+            return self._handle_poll_failure(err)
+
+        if self.consecutive_failures >= FAILURE_THRESHOLD:
+            # The base class logs the recovery itself
+            _LOGGER.debug(
+                "%s answered again after %d failed polls",
+                self.client.ip_address,
+                self.consecutive_failures,
+            )
+        self.consecutive_failures = 0
+        self.stale = False
+        self.last_updated = dt_util.utcnow()
+        now = time.monotonic()
+        self.thermal.update(snapshot, now)
+        self.readings.update(snapshot, now)
+        self._async_schedule_save()
+        if self.desired and not self._reconciling:
+            self.hass.async_create_task(self._async_reconcile())
+        return snapshot
+
+    def _handle_poll_failure(self, err: Exception) -> dict[str, dict[str, Any]]:
+        """Keep the last snapshot through short outages, then fail the whole unit.
+
+        The base class logs the transition to unavailable once; while the unit
+        stays down, a reminder is logged at most every UNAVAILABLE_LOG_INTERVAL.
+        """
+        self.consecutive_failures += 1
+        if self.data is not None and self.consecutive_failures < FAILURE_THRESHOLD:
+            _LOGGER.debug(
+                "Poll %d/%d of %s failed, keeping last snapshot: %s",
+                self.consecutive_failures,
+                FAILURE_THRESHOLD,
+                self.client.ip_address,
+                err,
+            )
+            return self.data
+
+        now = time.monotonic()
+        if self.last_update_success:
+            self._last_unavailable_log = now
+        elif now - self._last_unavailable_log >= UNAVAILABLE_LOG_INTERVAL:
+            self._last_unavailable_log = now
+            _LOGGER.warning(
+                "%s is still unreachable after %d failed polls: %s",
+                self.client.ip_address,
+                self.consecutive_failures,
+                err,
+            )
+        raise UpdateFailed(
+            f"Error communicating with {self.client.ip_address}: {err}"
+        ) from err
+
+    @callback
+    def _async_queue_intent(self, changes: dict[str, str]) -> None:
+        """Remember control changes that did not reach the unit."""
+        now = time.monotonic()
+        for param, value in changes.items():
+            self.desired[param] = (value, now)
+        _LOGGER.info(
+            "Could not send %s to %s, will apply it once the unit answers again",
+            changes,
+            self.client.ip_address,
+        )
+
+    async def _async_reconcile(self) -> None:
+        """Apply the latest desired state in one write after the unit is back."""
+        self._reconciling = True
+        try:
+            now = time.monotonic()
+            pending = {
+                param: value
+                for param, (value, queued) in self.desired.items()
+                if now - queued <= INTENT_TTL
+            }
+            if expired := self.desired.keys() - pending.keys():
+                _LOGGER.debug(
+                    "Dropping expired intent for %s: %s",
+                    self.client.ip_address,
+                    sorted(expired),
+                )
+            queued_at = {param: self.desired[param][1] for param in pending}
+            self.desired.clear()
+            if not pending:
+                return
+            try:
+                if await self.async_update_control(**pending):
+                    _LOGGER.info(
+                        "Applied queued settings to %s: %s", self.client.ip_address, pending
+                    )
+                    return
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug("Replaying intent to %s failed: %s", self.client.ip_address, err)
+            # A write that did not reach the unit was queued again by
+            # async_update_control; keep its original age so the TTL still applies
+            for param, (value, _) in list(self.desired.items()):
+                if param in queued_at and value == pending[param]:
+                    self.desired[param] = (value, queued_at[param])
+        finally:
+            self._reconciling = False
+
+    async def async_update_control(self, force: bool = False, **changes: str) -> bool:
+        """Write control changes to the unit and apply them to the snapshot.
+
+        While the unit is unavailable, and when a write does not reach it, the
+        changes are kept as the desired state and replayed in one write after
+        the next successful poll, unless they are older than INTENT_TTL by
+        then. A write the unit answers but rejects is not queued; replaying it
+        would only be rejected again.
+        """
+        if not self.last_update_success:
+            self._async_queue_intent(changes)
+            raise HomeAssistantError(
+                f"{self.client.ip_address} is unreachable, the change will be "
+                "applied once it answers again"
+            )
+
+        try:
+            async with self._io_lock:
+                success = await self.executor.async_run(
+                    lambda: self.client.update_control_info(
+                        timeout=CONTROL_TIMEOUT, force=force, **changes
+                    )
+                )
+        except Exception:
+            self._async_queue_intent(changes)
+            raise
+        if not success:
+            return False
+
+        # Newer values supersede anything still queued for the same fields
+        for param in changes:
+            self.desired.pop(param, None)
+        if self.data is not None:
+            snapshot = dict(self.data)
+            snapshot[SNAPSHOT_CONTROL_INFO] = {
+                **snapshot.get(SNAPSHOT_CONTROL_INFO, {}),
+                **changes,
+            }
+            # The base class reschedules the next poll one update_interval from
+            # now; keep it on the unit's slot instead, however close that is
+            self.update_interval = timedelta(seconds=self._seconds_to_slot())
+            self.async_set_updated_data(snapshot)
+            self._async_schedule_save()
+        return success
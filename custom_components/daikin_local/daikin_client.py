@@ -1,38 +1,43 @@
 """Daikin Local API client."""
+from collections import Counter, OrderedDict
+import heapq
+import http.client
+import itertools
 import logging
 import os
+import socket
+import ssl
 import subprocess
 import tempfile
-from typing import Any, Dict, Optional
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+import warnings
 
 from .const import (
+    CONTROL_PARAMS,
+    CONTROL_SNAPSHOT_MAX_AGE,
     DEFAULT_PORT,
+    DEFAULT_REQUEST_TIMEOUT,
     DEFAULT_TIMEOUT,
     ENDPOINT_BASIC_INFO,
     ENDPOINT_CONTROL_INFO,
     ENDPOINT_SENSOR_INFO,
     ENDPOINT_SET_CONTROL,
     ENDPOINT_REGISTER_TERMINAL,
+    HTTP_POOL_SIZE,
+    HTTP_PORT,
+    PROTOCOL_HTTP,
+    PROTOCOL_HTTPS,
+    SNAPSHOT_BASIC_INFO,
+    SNAPSHOT_CONTROL_INFO,
+    SNAPSHOT_SENSOR_INFO,
+    TLS_SESSION_CACHE_SIZE,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-
-class DaikinClient:
-    """Client for communicating with Daikin air conditioner."""
-
-    def __init__(self, ip_address: str, uuid: str, key: str, port: int = 443):
-        """Initialize the Daikin client."""
-        self.ip_address = ip_address
-        self.uuid = uuid
-        self.key = key
-        self.port = port
-        self.base_url = f"https://{ip_address}:{port}"
-        self._ssl_config_file = None
-
-    def _create_ssl_config(self) -> str:
-        """Create temporary OpenSSL configuration for legacy renegotiation."""
-        config_content = """openssl_conf = openssl_init
+OPENSSL_LEGACY_CONFIG = """openssl_conf = openssl_init
 
 [openssl_init]
 ssl_conf = ssl_sect
@@ -46,25 +51,419 @@ CipherString = DEFAULT@SECLEVEL=0
 MinProtocol = TLSv1
 MaxProtocol = TLSv1.3
 """
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.conf', delete=False) as f:
-            f.write(config_content)
-            return f.name
+
+
+def create_ssl_config() -> str:
+    """Write the legacy OpenSSL configuration to a temporary file."""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.conf', delete=False) as f:
+        f.write(OPENSSL_LEGACY_CONFIG)
+        return f.name
+
+
+class SharedSSLConfig:
+    """Reference-counted legacy OpenSSL config file shared by all users.
+
+    The file is written on the first acquire and removed when the last user
+    releases it, so reloads and config flow retries never leave copies behind.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the shared config."""
+        self.refs = 0
+        self._path: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def acquire(self) -> str:
+        """Take a reference and return the config file path."""
+        with self._lock:
+            if self._path is None or not os.path.exists(self._path):
+                self._path = create_ssl_config()
+            self.refs += 1
+            return self._path
+
+    def release(self) -> None:
+        """Drop a reference, removing the file with the last one."""
+        with self._lock:
+            self.refs = max(0, self.refs - 1)
+            if self.refs == 0 and self._path is not None:
+                try:
+                    os.unlink(self._path)
+                except OSError:
+                    pass
+                self._path = None
+
+
+SSL_CONFIG = SharedSSLConfig()
+
+
+# OpenSSL option bits not exported by the ssl module on every Python version
+SSL_OP_LEGACY_SERVER_CONNECT = 0x4
+SSL_OP_ALLOW_UNSAFE_LEGACY_RENEGOTIATION = 0x40000
+
+
+class TLSSessionCache:
+    """Thread-safe LRU of TLS sessions, keyed by (host, port).
+
+    Resuming a session skips the RSA key exchange, which is the slowest part of
+    talking to a Daikin module. The cache is shared by all clients so the bound
+    applies to the whole fleet.
+    """
+
+    def __init__(self, maxsize: int = TLS_SESSION_CACHE_SIZE):
+        """Initialize the cache."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._sessions: "OrderedDict[Tuple[str, int], ssl.SSLSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, int]) -> Optional[ssl.SSLSession]:
+        """Return the cached session for a host, if any."""
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._sessions.move_to_end(key)
+            return session
+
+    def put(self, key: Tuple[str, int], session: Optional[ssl.SSLSession]) -> None:
+        """Store the session of a completed connection."""
+        if session is None:
+            return
+        with self._lock:
+            self._sessions[key] = session
+            self._sessions.move_to_end(key)
+            while len(self._sessions) > self.maxsize:
+                self._sessions.popitem(last=False)
+
+    def discard(self, key: Tuple[str, int]) -> None:
+        """Forget the session of a host, e.g. after a failed resumption."""
+        with self._lock:
+            self._sessions.pop(key, None)
+
+    def record(self, reused: bool) -> None:
+        """Count a handshake as a resumption hit or a full handshake miss."""
+        with self._lock:
+            if reused:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit, miss and size counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._sessions),
+                "maxsize": self.maxsize,
+            }
+
+
+SESSION_CACHE = TLSSessionCache()
+
+
+class _Watch:
+    """A socket watched until its deadline."""
+
+    __slots__ = ("sock", "done", "fired")
+
+    def __init__(self, sock: socket.socket):
+        """Initialize the watch."""
+        self.sock = sock
+        self.done = False
+        self.fired = False
+
+
+class DeadlineWatchdog:
+    """Shut down connections that are still in use at their deadline.
+
+    Socket timeouts only bound each receive, so a unit trickling its answer
+    a byte at a time never trips them. One shared thread shuts the
+    connection down at the deadline, which fails the blocked call at once.
+    It works on a duplicate of the descriptor, so the shutdown still reaches
+    the connection after ssl has taken over the original socket object.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the watchdog; its thread starts on first use."""
+        self._cond = threading.Condition()
+        self._heap: list = []
+        self._sequence = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, sock: socket.socket, deadline: float) -> _Watch:
+        """Shut sock's connection down at the deadline unless cancelled first."""
+        watch = _Watch(socket.socket(fileno=os.dup(sock.fileno())))
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, next(self._sequence), watch))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="daikin_local_watchdog", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return watch
+
+    def cancel(self, watch: _Watch) -> bool:
+        """Stop watching; returns True if the connection was already shut down."""
+        with self._cond:
+            if watch.done:
+                return watch.fired
+            watch.done = True
+        watch.sock.close()
+        return False
+
+    def _run(self) -> None:
+        """Shut down every connection whose deadline has passed."""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                while self._heap and (self._heap[0][2].done or self._heap[0][0] <= now):
+                    _, _, watch = heapq.heappop(self._heap)
+                    if watch.done:
+                        continue
+                    watch.done = watch.fired = True
+                    try:
+                        watch.sock.shutdown(socket.SHUT_RDWR)
+                    except OSError:
+                        pass
+                    watch.sock.close()
+                self._cond.wait(self._heap[0][0] - now if self._heap else None)
+
+
+WATCHDOG = DeadlineWatchdog()
+
+_native_context: Optional[ssl.SSLContext] = None
+_native_context_lock = threading.Lock()
+
+
+def _get_native_context() -> ssl.SSLContext:
+    """Return the shared SSL context; sessions only resume within one context."""
+    global _native_context
+    with _native_context_lock:
+        if _native_context is None:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+            context.options |= (
+                SSL_OP_LEGACY_SERVER_CONNECT | SSL_OP_ALLOW_UNSAFE_LEGACY_RENEGOTIATION
+            )
+            context.set_ciphers("DEFAULT@SECLEVEL=0")
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", DeprecationWarning)
+                context.minimum_version = ssl.TLSVersion.TLSv1
+            _native_context = context
+        return _native_context
+
+
+class _ResumingHTTPSConnection(http.client.HTTPSConnection):
+    """HTTPS connection that offers a cached TLS session when connecting."""
+
+    def __init__(self, host: str, port: int, session: Optional[ssl.SSLSession], deadline: float):
+        """Initialize the connection."""
+        super().__init__(host, port, timeout=_phase_timeout(deadline), context=_get_native_context())
+        self._deadline = deadline
+        self._session = session
+        self.watch: Optional[_Watch] = None
+        self.handshake_time = 0.0
+        # Kept from the handshake; the socket is gone once a
+        # "Connection: close" response has been read
+        self.session: Optional[ssl.SSLSession] = None
+        self.session_reused = False
+
+    def connect(self) -> None:
+        """Open the TCP connection and wrap it, resuming the session if possible."""
+        http.client.HTTPConnection.connect(self)
+        self.watch = WATCHDOG.watch(self.sock, self._deadline)
+        # The handshake only gets what the TCP connect left of the deadline
+        self.sock.settimeout(_phase_timeout(self._deadline))
+        start = time.monotonic()
+        self.sock = self._context.wrap_socket(
+            self.sock, server_hostname=self.host, session=self._session
+        )
+        self.handshake_time = time.monotonic() - start
+        self.session = self.sock.session
+        self.session_reused = self.sock.session_reused
+
+
+class HTTPConnectionPool:
+    """Idle keep-alive connections to one plain-HTTP unit.
+
+    Units without TLS answer in a few milliseconds once connected, so reusing
+    the TCP connection is most of the saving. At most maxsize idle
+    connections are kept; extra ones are closed when they are handed back.
+    """
+
+    def __init__(self, host: str, port: int, maxsize: int = HTTP_POOL_SIZE):
+        """Initialize an empty pool."""
+        self.host = host
+        self.port = port
+        self.maxsize = maxsize
+        self.created = 0
+        self.reused = 0
+        self._idle: list = []
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return an idle connection, or a new one connecting within timeout.
+
+        The caller sets the socket timeout of each later phase itself.
+        """
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+            if conn is not None:
+                self.reused += 1
+            else:
+                self.created += 1
+        if conn is None:
+            return http.client.HTTPConnection(self.host, self.port, timeout=timeout), False
+        return conn, True
+
+    def release(self, conn: http.client.HTTPConnection) -> None:
+        """Keep a connection whose response was fully read for reuse."""
+        with self._lock:
+            if len(self._idle) < self.maxsize:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        """Return connection counters."""
+        with self._lock:
+            return {
+                "created": self.created,
+                "reused": self.reused,
+                "idle": len(self._idle),
+                "maxsize": self.maxsize,
+            }
+
+
+# TLS profiles tried in order: (name, curl TLS flag, use legacy OpenSSL config)
+TLS_PROFILES = (
+    ("tls1.2-legacy", "--tlsv1.2", True),
+    ("tls1.2", "--tlsv1.2", False),
+    ("tls1.0", "--tlsv1", False),
+)
+
+# Attempts with less time left than this are not started
+MIN_ATTEMPT_TIME = 0.5
+CURL_EXIT_GRACE = 1.0
+
+CURL_TIMING_MARKER = "\n#curl-timing#"
+CURL_TIMING_FORMAT = CURL_TIMING_MARKER + "%{time_connect} %{time_appconnect} %{time_total}"
+
+
+def _deadline(timeout: Optional[float]) -> float:
+    """Return the monotonic deadline for a call with the given overall timeout."""
+    return time.monotonic() + (DEFAULT_REQUEST_TIMEOUT if timeout is None else timeout)
+
+
+def _remaining(deadline: float) -> float:
+    """Return the seconds left until a deadline."""
+    return deadline - time.monotonic()
+
+
+def _phase_timeout(deadline: float) -> float:
+    """Return the socket timeout for the next phase of a request.
+
+    Each phase (connect, handshake, send, response) only gets the time left
+    until the deadline, so the whole request cannot outlive it.
+    """
+    remaining = _remaining(deadline)
+    if remaining <= 0:
+        raise TimeoutError("deadline exceeded")
+    return min(DEFAULT_TIMEOUT, remaining)
+
+
+def _parse_timing(timing: str) -> Dict[str, float]:
+    """Parse the curl timing write-out into seconds per phase."""
+    try:
+        connect, handshake, total = (float(value) for value in timing.split())
+    except ValueError:
+        return {}
+    return {"connect": connect, "handshake": handshake - connect, "total": total}
+
+
+def _same_value(current: Any, requested: Any) -> bool:
+    """Return True if a control value already matches, so "24" equals "24.0"."""
+    if str(current) == str(requested):
+        return True
+    try:
+        return float(current) == float(requested)
+    except (TypeError, ValueError):
+        return False
+
+
+def parse_response(body: str) -> Dict[str, str]:
+    """Parse a Daikin ``k=v,k=v`` response body into a dictionary."""
+    data = {}
+    for line in body.strip().split(','):
+        if '=' in line:
+            key, value = line.split('=', 1)
+            data[key] = value
+    return data
+
+
+class DaikinClient:
+    """Client for communicating with Daikin air conditioner."""
+
+    def __init__(
+        self,
+        ip_address: str,
+        uuid: str = "",
+        key: str = "",
+        port: Optional[int] = None,
+        protocol: str = PROTOCOL_HTTPS,
+    ):
+        """Initialize the Daikin client.
+
+        Units answering plain HTTP need no uuid or key; the port defaults to
+        the protocol's own.
+        """
+        self.ip_address = ip_address
+        self.uuid = uuid
+        self.key = key
+        self.protocol = protocol
+        if port is None:
+            port = HTTP_PORT if protocol == PROTOCOL_HTTP else DEFAULT_PORT
+        self.port = port
+        self.base_url = f"{protocol}://{ip_address}:{port}"
+        self.http_pool: Optional[HTTPConnectionPool] = (
+            HTTPConnectionPool(ip_address, port) if protocol == PROTOCOL_HTTP else None
+        )
+        self._ssl_config_file = None
+        self.last_profile: Optional[str] = None
+        self.last_timing: Dict[str, float] = {}
+        self._native_tls = True
+        self.suppressed_writes = 0
+        # Round trips handed to the transport, per endpoint
+        self.requests: Counter = Counter()
+        self._control_info: Dict[str, Any] = {}
+        self._control_info_time = 0.0
+        # Seam for record and replay: (endpoint, params, deadline) -> raw body
+        self.transport: Callable[[str, Dict[str, Any], float], str] = self._fetch_endpoint
 
     def _get_ssl_config(self) -> str:
-        """Get or create SSL configuration file."""
+        """Get the shared SSL configuration file, holding a reference until close()."""
         if self._ssl_config_file is None:
-            self._ssl_config_file = self._create_ssl_config()
+            self._ssl_config_file = SSL_CONFIG.acquire()
         return self._ssl_config_file
 
-    def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Make a request to the Daikin API using curl."""
+    def _build_url(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the request URL, adding the key to the parameters."""
         url = f"{self.base_url}{endpoint}"
         
-        # Add key to parameters
-        if params is None:
-            params = {}
-        params["key"] = self.key
+        # Add key to parameters; unkeyed units get none
+        params = dict(params or {})
+        if self.key:
+            params["key"] = self.key
         
         # Build query string
         query_parts = []
@@ -74,74 +473,117 @@ MaxProtocol = TLSv1.3
         
         if query_string:
             url = f"{url}?{query_string}"
-        
-        ssl_config_file = self._get_ssl_config()
-        
-        # Try multiple SSL configurations
-        curl_configs = [
-            # Primary configuration with OpenSSL config
-            {
-                'env': {**os.environ, 'OPENSSL_CONF': ssl_config_file},
-                'args': [
-                    'curl', '--insecure', '--silent', '--show-error',
-                    '--tlsv1.2', '--ciphers', 'DEFAULT@SECLEVEL=0',
-                    '--retry', '3', '--retry-delay', '1',
-                    '--connect-timeout', '10', '--max-time', '30',
-                    '-H', f'X-Daikin-uuid: {self.uuid}',
-                    '-H', 'User-Agent: HomeAssistant-DaikinLocal/1.0',
-                    url
-                ]
-            },
-            # Fallback configuration without OpenSSL config
-            {
-                'env': os.environ.copy(),
-                'args': [
-                    'curl', '--insecure', '--silent', '--show-error',
-                    '--tlsv1.2', '--ciphers', 'DEFAULT@SECLEVEL=0',
-                    '--retry', '3', '--retry-delay', '1',
-                    '--connect-timeout', '10', '--max-time', '30',
-                    '-H', f'X-Daikin-uuid: {self.uuid}',
-                    '-H', 'User-Agent: HomeAssistant-DaikinLocal/1.0',
-                    url
-                ]
-            },
-            # Legacy configuration
-            {
-                'env': os.environ.copy(),
-                'args': [
-                    'curl', '--insecure', '--silent', '--show-error',
-                    '--tlsv1', '--ciphers', 'DEFAULT@SECLEVEL=0',
-                    '--retry', '3', '--retry-delay', '1',
-                    '--connect-timeout', '10', '--max-time', '30',
-                    '-H', f'X-Daikin-uuid: {self.uuid}',
-                    '-H', 'User-Agent: HomeAssistant-DaikinLocal/1.0',
-                    url
-                ]
-            }
+        return url
+
+    def _headers(self) -> Dict[str, str]:
+        """Return the request headers, with the uuid for registered terminals."""
+        headers = {"User-Agent": "HomeAssistant-DaikinLocal/1.0"}
+        if self.uuid:
+            headers["X-Daikin-uuid"] = self.uuid
+        return headers
+
+    def _curl_args(self, tls_flag: str, url: str, budget: float) -> list:
+        """Build the curl command line for one TLS profile within a time budget."""
+        # No --retry: the profile chain is the retry loop, and it shares one deadline
+        return [
+            'curl', '--insecure', '--silent', '--show-error',
+            tls_flag, '--ciphers', 'DEFAULT@SECLEVEL=0',
+            '--connect-timeout', f'{min(DEFAULT_TIMEOUT, budget):.3f}',
+            '--max-time', f'{budget:.3f}',
+            *(arg for name, value in self._headers().items() for arg in ('-H', f'{name}: {value}')),
+            '-w', CURL_TIMING_FORMAT,
+            url
         ]
+
+    def _fetch_native(self, url: str, deadline: float) -> str:
+        """Fetch a URL in-process, resuming a cached TLS session when there is one."""
+        cache_key = (self.ip_address, self.port)
+        session = SESSION_CACHE.get(cache_key)
+        start = time.monotonic()
+        conn = None
+        try:
+            conn = _ResumingHTTPSConnection(self.ip_address, self.port, session, deadline)
+            conn.connect()
+            # The connection drops its socket once a closing response is read
+            sock = conn.sock
+            sock.settimeout(_phase_timeout(deadline))
+            conn.request(
+                "GET",
+                url[len(self.base_url):],
+                headers=self._headers(),
+            )
+            sock.settimeout(_phase_timeout(deadline))
+            response = conn.getresponse()
+            sock.settimeout(_phase_timeout(deadline))
+            body = response.read().decode(errors="replace")
+            reused = conn.session_reused
+            SESSION_CACHE.record(reused)
+            SESSION_CACHE.put(cache_key, conn.session)
+        except Exception:
+            if session is not None:
+                SESSION_CACHE.discard(cache_key)
+            raise
+        finally:
+            if conn is not None:
+                if conn.watch is not None:
+                    WATCHDOG.cancel(conn.watch)
+                conn.close()
+
+        self.last_profile = "native-resumed" if reused else "native"
+        self.last_timing = {
+            "handshake": conn.handshake_time,
+            "total": time.monotonic() - start,
+        }
+        return body
+
+    def _fetch(self, url: str, deadline: float) -> str:
+        """Fetch a URL, trying the in-process transport and then each curl TLS profile.
+
+        Every attempt only gets the time left until the deadline, so the whole
+        chain never takes longer than the caller's budget.
+        """
+        if self._native_tls and _remaining(deadline) > MIN_ATTEMPT_TIME:
+            try:
+                return self._fetch_native(url, deadline)
+            except ssl.SSLError as err:
+                # The module's TLS stack is not compatible with Python's ssl;
+                # stick to curl for this client from now on
+                _LOGGER.debug("Native TLS failed, falling back to curl: %s", err)
+                self._native_tls = False
+            except Exception as err:  # pylint: disable=broad-except
+                # Any other failure of the in-process attempt still leaves curl
+                _LOGGER.debug("Native request failed, trying curl: %s", err)
+
+        ssl_config_file = self._get_ssl_config()
         
         last_error = None
-        for i, config in enumerate(curl_configs):
+        for i, (profile, tls_flag, use_legacy_conf) in enumerate(TLS_PROFILES):
+            budget = _remaining(deadline)
+            if budget < MIN_ATTEMPT_TIME:
+                last_error = f"deadline exceeded before config {i + 1}"
+                break
+            env = os.environ.copy()
+            if use_legacy_conf:
+                env['OPENSSL_CONF'] = ssl_config_file
             try:
-                _LOGGER.debug("Trying curl configuration %d", i + 1)
+                _LOGGER.debug("Trying curl configuration %d (%s)", i + 1, profile)
                 result = subprocess.run(
-                    config['args'],
+                    self._curl_args(tls_flag, url, budget),
                     capture_output=True,
                     text=True,
-                    env=config['env'],
-                    timeout=DEFAULT_TIMEOUT
+                    env=env,
+                    # curl enforces --max-time itself; this only guards a stuck process
+                    timeout=budget + CURL_EXIT_GRACE
                 )
                 
                 if result.returncode == 0:
-                    # Parse response
-                    data = {}
-                    for line in result.stdout.strip().split(','):
-                        if '=' in line:
-                            key, value = line.split('=', 1)
-                            data[key] = value
-                    
+                    body, marker, timing = result.stdout.rpartition(CURL_TIMING_MARKER)
+                    if not marker:
+                        body, timing = timing, ""
+                    self.last_profile = profile
+                    self.last_timing = _parse_timing(timing)
                     _LOGGER.debug("Successfully connected using configuration %d", i + 1)
-                    return data
+                    return body
                 else:
                     last_error = f"curl failed (config {i + 1}): {result.stderr}"
                     _LOGGER.debug("Configuration %d failed: %s", i + 1, result.stderr)
@@ -156,132 +598,211 @@ MaxProtocol = TLSv1.3
         # If all configurations failed
         raise Exception(f"All curl configurations failed. Last error: {last_error}")
 
-    def _make_set_request(self, endpoint: str, params: Dict[str, Any]) -> bool:
-        """Make a set request to the Daikin API using curl."""
-        url = f"{self.base_url}{endpoint}"
-        
-        # Add key to parameters
-        params["key"] = self.key
-        
-        # Build query string
-        query_parts = []
-        for key, value in params.items():
-            query_parts.append(f"{key}={value}")
-        query_string = "&".join(query_parts)
-        
-        if query_string:
-            url = f"{url}?{query_string}"
-        
-        ssl_config_file = self._get_ssl_config()
-        
-        # Try multiple SSL configurations
-        curl_configs = [
-            # Primary configuration with OpenSSL config
-            {
-                'env': {**os.environ, 'OPENSSL_CONF': ssl_config_file},
-                'args': [
-                    'curl', '--insecure', '--silent', '--show-error',
-                    '--tlsv1.2', '--ciphers', 'DEFAULT@SECLEVEL=0',
-                    '--retry', '3', '--retry-delay', '1',
-                    '--connect-timeout', '10', '--max-time', '30',
-                    '-H', f'X-Daikin-uuid: {self.uuid}',
-                    '-H', 'User-Agent: HomeAssistant-DaikinLocal/1.0',
-                    url
-                ]
-            },
-            # Fallback configuration without OpenSSL config
-            {
-                'env': os.environ.copy(),
-                'args': [
-                    'curl', '--insecure', '--silent', '--show-error',
-                    '--tlsv1.2', '--ciphers', 'DEFAULT@SECLEVEL=0',
-                    '--retry', '3', '--retry-delay', '1',
-                    '--connect-timeout', '10', '--max-time', '30',
-                    '-H', f'X-Daikin-uuid: {self.uuid}',
-                    '-H', 'User-Agent: HomeAssistant-DaikinLocal/1.0',
-                    url
-                ]
-            },
-            # Legacy configuration
-            {
-                'env': os.environ.copy(),
-                'args': [
-                    'curl', '--insecure', '--silent', '--show-error',
-                    '--tlsv1', '--ciphers', 'DEFAULT@SECLEVEL=0',
-                    '--retry', '3', '--retry-delay', '1',
-                    '--connect-timeout', '10', '--max-time', '30',
-                    '-H', f'X-Daikin-uuid: {self.uuid}',
-                    '-H', 'User-Agent: HomeAssistant-DaikinLocal/1.0',
-                    url
-                ]
-            }
-        ]
-        
-        for i, config in enumerate(curl_configs):
+    def _fetch_http(self, url: str, deadline: float) -> str:
+        """Fetch a URL over plain HTTP on a pooled keep-alive connection.
+
+        A reused connection the unit has already closed is retried once on a
+        new connection, within the same deadline.
+        """
+        assert self.http_pool is not None
+        path = url[len(self.base_url):]
+        last_error: Optional[Exception] = None
+        for _ in range(2):
+            budget = _remaining(deadline)
+            if budget < MIN_ATTEMPT_TIME:
+                break
+            conn, reused = self.http_pool.acquire(min(DEFAULT_TIMEOUT, budget))
+            start = time.monotonic()
+            watch = None
             try:
-                _LOGGER.debug("Trying set request with curl configuration %d", i + 1)
-                result = subprocess.run(
-                    config['args'],
-                    capture_output=True,
-                    text=True,
-                    env=config['env'],
-                    timeout=DEFAULT_TIMEOUT
-                )
-                
-                if result.returncode == 0:
-                    # Check response
-                    success = "ret=OK" in result.stdout
-                    if success:
-                        _LOGGER.debug("Set request successful using configuration %d", i + 1)
-                    return success
-                else:
-                    _LOGGER.debug("Set request configuration %d failed: %s", i + 1, result.stderr)
-                    
-            except subprocess.TimeoutExpired:
-                _LOGGER.debug("Set request configuration %d timed out", i + 1)
-            except Exception as err:
-                _LOGGER.debug("Set request configuration %d error: %s", i + 1, err)
-        
-        _LOGGER.error("All set request configurations failed")
-        return False
+                if conn.sock is None:
+                    conn.connect()
+                # The connection drops its socket once a closing response is read
+                sock = conn.sock
+                watch = WATCHDOG.watch(sock, deadline)
+                sock.settimeout(_phase_timeout(deadline))
+                conn.request("GET", path, headers=self._headers())
+                sock.settimeout(_phase_timeout(deadline))
+                response = conn.getresponse()
+                sock.settimeout(_phase_timeout(deadline))
+                body = response.read().decode(errors="replace")
+            except (OSError, http.client.HTTPException) as err:
+                if watch is not None:
+                    WATCHDOG.cancel(watch)
+                conn.close()
+                last_error = err
+                if reused:
+                    _LOGGER.debug("Idle connection to %s failed, reconnecting: %s", self.ip_address, err)
+                    continue
+                break
 
-    def test_connection(self) -> bool:
+            # A connection shut down at the deadline cannot be reused
+            if WATCHDOG.cancel(watch) or response.will_close:
+                conn.close()
+            else:
+                self.http_pool.release(conn)
+            self.last_profile = "http-reused" if reused else "http"
+            self.last_timing = {"total": time.monotonic() - start}
+            return body
+
+        raise Exception(f"HTTP request failed: {last_error or 'deadline exceeded'}")
+
+    def _fetch_endpoint(self, endpoint: str, params: Dict[str, Any], deadline: float) -> str:
+        """Fetch an endpoint from the unit; the default transport."""
+        url = self._build_url(endpoint, params)
+        if self.http_pool is not None:
+            return self._fetch_http(url, deadline)
+        return self._fetch(url, deadline)
+
+    def _make_request(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Make a request to the Daikin API, finishing before the deadline."""
+        if deadline is None:
+            deadline = _deadline(None)
+        self.requests[endpoint] += 1
+        return parse_response(self.transport(endpoint, params or {}, deadline))
+
+    def _make_set_request(
+        self, endpoint: str, params: Dict[str, Any], deadline: Optional[float] = None
+    ) -> bool:
+        """Make a set request to the Daikin API, finishing before the deadline.
+
+        Returns False if the unit answered but rejected the request; raises if
+        the request did not get an answer at all.
+        """
+        if deadline is None:
+            deadline = _deadline(None)
+        self.requests[endpoint] += 1
+        body = self.transport(endpoint, params, deadline)
+
+        success = "ret=OK" in body
+        if success:
+            _LOGGER.debug("Set request successful using %s", self.last_profile)
+        else:
+            _LOGGER.warning("%s rejected %s: %s", self.ip_address, params, body.strip())
+        return success
+
+    def _remember_control_info(
+        self, control_info: Dict[str, Any], read: bool = True
+    ) -> Dict[str, Any]:
+        """Keep the latest control info to detect writes that change nothing.
+
+        A read that disagrees with the remembered settings means the unit was
+        changed elsewhere, e.g. with its IR remote, so it is not trusted to
+        skip writes until a later read agrees with it.
+        """
+        changed_elsewhere = read and any(
+            not _same_value(self._control_info[param], control_info[param])
+            for param in CONTROL_PARAMS
+            if param in self._control_info and param in control_info
+        )
+        self._control_info = dict(control_info)
+        self._control_info_time = 0.0 if changed_elsewhere else time.monotonic()
+        return control_info
+
+    def _is_noop(self, changes: Dict[str, Any]) -> bool:
+        """Return True if recent control info already has every requested value."""
+        if time.monotonic() - self._control_info_time > CONTROL_SNAPSHOT_MAX_AGE:
+            return False
+        return all(
+            param in self._control_info and _same_value(self._control_info[param], value)
+            for param, value in changes.items()
+        )
+
+    def _suppress_write(self, changes: Dict[str, Any]) -> bool:
+        """Count and log a write that was skipped because nothing would change."""
+        self.suppressed_writes += 1
+        _LOGGER.debug("Skipping write to %s, already set: %s", self.ip_address, changes)
+        return True
+
+    def test_connection(self, timeout: Optional[float] = None) -> bool:
         """Test connection to the Daikin unit."""
         try:
-            data = self._make_request(ENDPOINT_BASIC_INFO)
+            data = self._make_request(ENDPOINT_BASIC_INFO, deadline=_deadline(timeout))
             return "ret" in data and data["ret"] == "OK"
         except Exception as err:
             _LOGGER.error("Connection test failed: %s", err)
             return False
 
-    def register_terminal(self) -> bool:
+    def register_terminal(self, timeout: Optional[float] = None) -> bool:
         """Register this terminal with the Daikin unit."""
         try:
-            data = self._make_request(ENDPOINT_REGISTER_TERMINAL)
+            data = self._make_request(ENDPOINT_REGISTER_TERMINAL, deadline=_deadline(timeout))
             return "ret" in data and data["ret"] == "OK"
         except Exception as err:
             _LOGGER.error("Terminal registration failed: %s", err)
             return False
 
-    def get_basic_info(self) -> Dict[str, Any]:
+    def get_basic_info(self, timeout: Optional[float] = None) -> Dict[str, Any]:
         """Get basic device information."""
-        return self._make_request(ENDPOINT_BASIC_INFO)
+        return self._make_request(ENDPOINT_BASIC_INFO, deadline=_deadline(timeout))
 
-    def get_control_info(self) -> Dict[str, Any]:
+    def get_control_info(self, timeout: Optional[float] = None) -> Dict[str, Any]:
         """Get current control settings."""
-        return self._make_request(ENDPOINT_CONTROL_INFO)
+        return self._remember_control_info(
+            self._make_request(ENDPOINT_CONTROL_INFO, deadline=_deadline(timeout))
+        )
 
-    def get_sensor_info(self) -> Dict[str, Any]:
+    def get_sensor_info(self, timeout: Optional[float] = None) -> Dict[str, Any]:
         """Get current sensor data."""
-        return self._make_request(ENDPOINT_SENSOR_INFO)
+        return self._make_request(ENDPOINT_SENSOR_INFO, deadline=_deadline(timeout))
+
+    def get_snapshot(self, timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """Get device, control and sensor data in one poll sharing one deadline."""
+        deadline = _deadline(timeout)
+        return {
+            SNAPSHOT_BASIC_INFO: self._make_request(ENDPOINT_BASIC_INFO, deadline=deadline),
+            SNAPSHOT_CONTROL_INFO: self._remember_control_info(
+                self._make_request(ENDPOINT_CONTROL_INFO, deadline=deadline)
+            ),
+            SNAPSHOT_SENSOR_INFO: self._make_request(ENDPOINT_SENSOR_INFO, deadline=deadline),
+        }
+
+    def get_telemetry(self, timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """Get control and sensor data, without the static basic info, in one deadline."""
+        deadline = _deadline(timeout)
+        return {
+            SNAPSHOT_CONTROL_INFO: self._remember_control_info(
+                self._make_request(ENDPOINT_CONTROL_INFO, deadline=deadline)
+            ),
+            SNAPSHOT_SENSOR_INFO: self._make_request(ENDPOINT_SENSOR_INFO, deadline=deadline),
+        }
 
-    def set_control_info(self, **kwargs) -> bool:
-        """Set control parameters."""
+    def update_control_info(
+        self, timeout: Optional[float] = None, force: bool = False, **changes
+    ) -> bool:
+        """Apply changes on top of the current control settings in one write.
+
+        Unless force is set, nothing is sent when the latest known control
+        info already has the requested values.
+        """
+        if not force and self._is_noop(changes):
+            return self._suppress_write(changes)
+
+        deadline = _deadline(timeout)
+        control_info = self._remember_control_info(
+            self._make_request(ENDPOINT_CONTROL_INFO, deadline=deadline)
+        )
+        params = {
+            param: control_info[param]
+            for param in CONTROL_PARAMS
+            if param in control_info
+        }
+        params.update(changes)
+        return self.set_control_info(timeout=_remaining(deadline), force=force, **params)
+
+    def set_control_info(
+        self, timeout: Optional[float] = None, force: bool = False, **kwargs
+    ) -> bool:
+        """Set control parameters, skipping the write if nothing would change."""
         # Ensure all required parameters are present
-        required_params = ["pow", "mode", "stemp", "shum", "f_rate", "f_dir"]
         params = {}
         
-        for param in required_params:
+        for param in CONTROL_PARAMS:
             if param in kwargs:
                 params[param] = kwargs[param]
             else:
@@ -299,13 +820,18 @@ MaxProtocol = TLSv1.3
                 elif param == "f_dir":
                     params[param] = "0"
         
-        return self._make_set_request(ENDPOINT_SET_CONTROL, params)
+        if not force and self._is_noop(params):
+            return self._suppress_write(params)
+
+        success = self._make_set_request(ENDPOINT_SET_CONTROL, params, _deadline(timeout))
+        if success:
+            self._remember_control_info({**self._control_info, **params}, read=False)
+        return success
 
     def close(self):
         """Close the client and cleanup resources."""
+        if self.http_pool is not None:
+            self.http_pool.close()
         if self._ssl_config_file:
-            try:
-                os.unlink(self._ssl_config_file)
-            except OSError:
-                pass
+            SSL_CONFIG.release()
             self._ssl_config_file = None
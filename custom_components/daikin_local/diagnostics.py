@@ -0,0 +1,47 @@
+"""Diagnostics support for the Daikin Local integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_KEY, CONF_UUID, DOMAIN
+from .coordinator import DaikinCoordinator
+from .daikin_client import SESSION_CACHE
+
+TO_REDACT = {CONF_KEY, CONF_UUID, "mac", "ssid"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: DaikinCoordinator = hass.data[DOMAIN][entry.entry_id]
+    client = coordinator.client
+
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "options": dict(entry.options),
+        "snapshot": async_redact_data(coordinator.data or {}, TO_REDACT),
+        "stale": coordinator.stale,
+        "last_updated": coordinator.last_updated,
+        "consecutive_failures": coordinator.consecutive_failures,
+        "desired_state": {
+            param: value for param, (value, _) in coordinator.desired.items()
+        },
+        "poll_phase": coordinator.poll_phase,
+        "thermal_model": coordinator.thermal.as_dict(),
+        "rolling_readings": coordinator.readings.stats(),
+        "transport": {
+            "protocol": client.protocol,
+            "last_profile": client.last_profile,
+            "last_timing": client.last_timing,
+            "requests": dict(client.requests),
+            "suppressed_writes": client.suppressed_writes,
+            "tls_session_cache": SESSION_CACHE.stats(),
+            "http_pool": client.http_pool.stats() if client.http_pool else None,
+        },
+        "executor": coordinator.executor.stats(),
+    }
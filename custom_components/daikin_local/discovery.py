@@ -0,0 +1,242 @@
+"""Network discovery of Daikin units on the local network."""
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from dataclasses import dataclass, field
+import ipaddress
+import logging
+import os
+import socket
+from typing import Awaitable, Callable, Iterable
+from urllib.parse import unquote
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DEFAULT_PORT,
+    DISCOVERY_CONNECT_TIMEOUT,
+    DISCOVERY_FINGERPRINT_TIMEOUT,
+    DISCOVERY_MESSAGE,
+    DISCOVERY_SWEEP_CONCURRENCY,
+    DISCOVERY_TIMEOUT,
+    DISCOVERY_UDP_PORT,
+    DISCOVERY_UDP_SRC_PORT,
+    ENDPOINT_BASIC_INFO,
+    HTTP_PORT,
+    PROTOCOL_HTTP,
+    PROTOCOL_HTTPS,
+)
+from .daikin_client import SSL_CONFIG, parse_response
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class DiscoveredUnit:
+    """A Daikin unit found on the network."""
+
+    ip_address: str
+    info: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        """Return the name reported by the unit, URL-decoded."""
+        return unquote(self.info.get("name", "")) or self.ip_address
+
+    @property
+    def label(self) -> str:
+        """Return a human readable label for pick lists."""
+        details = [self.ip_address]
+        if mac := self.info.get("mac"):
+            details.append(mac)
+        if ver := self.info.get("ver"):
+            details.append(f"fw {ver.replace('_', '.')}")
+        return f"{self.name} ({', '.join(details)})"
+
+
+class _DiscoveryProtocol(asyncio.DatagramProtocol):
+    """Collect replies to the Daikin UDP discovery probe."""
+
+    def __init__(self) -> None:
+        """Initialize the protocol."""
+        self.found: dict[str, dict[str, str]] = {}
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Record a unit that answered the probe."""
+        info = parse_response(data.decode(errors="ignore"))
+        if info.get("ret") == "OK":
+            self.found[addr[0]] = info
+
+
+async def async_udp_discover(
+    broadcast_address: str = "255.255.255.255",
+    port: int = DISCOVERY_UDP_PORT,
+    src_port: int = DISCOVERY_UDP_SRC_PORT,
+    timeout: float = DISCOVERY_TIMEOUT,
+) -> dict[str, dict[str, str]]:
+    """Broadcast the Daikin discovery probe and collect replies."""
+    loop = asyncio.get_running_loop()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        sock.bind(("", src_port))
+    except OSError as err:
+        sock.close()
+        _LOGGER.debug("Cannot bind UDP discovery socket: %s", err)
+        return {}
+    sock.setblocking(False)
+
+    transport, protocol = await loop.create_datagram_endpoint(
+        _DiscoveryProtocol, sock=sock
+    )
+    try:
+        transport.sendto(DISCOVERY_MESSAGE, (broadcast_address, port))
+        await asyncio.sleep(timeout)
+    except OSError as err:
+        _LOGGER.debug("UDP discovery probe failed: %s", err)
+    finally:
+        transport.close()
+    return protocol.found
+
+
+def local_subnet_hosts() -> list[str]:
+    """Return the host addresses of the local /24 network."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        # Connecting a UDP socket sends nothing, it only selects a route
+        sock.connect(("10.255.255.255", 1))
+        local_ip = sock.getsockname()[0]
+    except OSError:
+        return []
+    finally:
+        sock.close()
+
+    network = ipaddress.ip_network(f"{local_ip}/24", strict=False)
+    return [str(host) for host in network.hosts() if str(host) != local_ip]
+
+
+async def _async_port_open(host: str, port: int, timeout: float) -> bool:
+    """Return True if a TCP connection to host:port succeeds."""
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), timeout
+        )
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    with suppress(OSError):
+        await writer.wait_closed()
+    return True
+
+
+async def async_fingerprint(
+    host: str,
+    port: int = DEFAULT_PORT,
+    ssl_config_file: str | None = None,
+    timeout: float = DISCOVERY_FINGERPRINT_TIMEOUT,
+    protocol: str = PROTOCOL_HTTPS,
+) -> dict[str, str] | None:
+    """Fetch basic_info from a host and return it if it looks like a Daikin unit."""
+    env = {**os.environ}
+    if ssl_config_file:
+        env["OPENSSL_CONF"] = ssl_config_file
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            'curl', '--insecure', '--silent',
+            '--ciphers', 'DEFAULT@SECLEVEL=0',
+            '--max-time', str(timeout),
+            '-H', 'User-Agent: HomeAssistant-DaikinLocal/1.0',
+            f"{protocol}://{host}:{port}{ENDPOINT_BASIC_INFO}",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=env,
+        )
+    except OSError as err:
+        _LOGGER.debug("Fingerprint of %s failed: %s", host, err)
+        return None
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout + 1)
+    except asyncio.TimeoutError:
+        with suppress(ProcessLookupError):
+            proc.kill()
+        await proc.wait()
+        _LOGGER.debug("Fingerprint of %s timed out", host)
+        return None
+
+    info = parse_response(stdout.decode(errors="ignore"))
+    # Units that reject an unauthenticated request still answer with ret=...
+    if "ret" not in info:
+        return None
+    return info
+
+
+async def async_sweep(
+    hass: HomeAssistant,
+    hosts: Iterable[str],
+    port: int = DEFAULT_PORT,
+    http_port: int = HTTP_PORT,
+    concurrency: int = DISCOVERY_SWEEP_CONCURRENCY,
+    connect_timeout: float = DISCOVERY_CONNECT_TIMEOUT,
+    fingerprint: Callable[[str, str], Awaitable[dict[str, str] | None]] | None = None,
+) -> dict[str, dict[str, str]]:
+    """Probe hosts for an open HTTP or HTTPS port and fingerprint the ones that answer.
+
+    Like setup, plain HTTP is tried first, so adapters without a key are found
+    without a TLS handshake.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    ssl_config_file = None
+    if fingerprint is None:
+        # Creating the shared OpenSSL config writes a file
+        ssl_config_file = await hass.async_add_executor_job(SSL_CONFIG.acquire)
+
+        async def fingerprint(host: str, protocol: str) -> dict[str, str] | None:
+            if protocol == PROTOCOL_HTTP:
+                return await async_fingerprint(host, http_port, protocol=PROTOCOL_HTTP)
+            return await async_fingerprint(host, port, ssl_config_file)
+
+    async def probe(host: str) -> tuple[str, dict[str, str] | None]:
+        async with semaphore:
+            http_open, https_open = await asyncio.gather(
+                _async_port_open(host, http_port, connect_timeout),
+                _async_port_open(host, port, connect_timeout),
+            )
+            info = None
+            if http_open:
+                info = await fingerprint(host, PROTOCOL_HTTP)
+            if info is None and https_open:
+                info = await fingerprint(host, PROTOCOL_HTTPS)
+            return host, info
+
+    try:
+        results = await asyncio.gather(*(probe(host) for host in hosts))
+    finally:
+        if ssl_config_file:
+            await hass.async_add_executor_job(SSL_CONFIG.release)
+
+    return {host: info for host, info in results if info is not None}
+
+
+async def async_discover_units(
+    hass: HomeAssistant,
+    hosts: Iterable[str] | None = None,
+    port: int = DEFAULT_PORT,
+    broadcast_address: str = "255.255.255.255",
+    udp_port: int = DISCOVERY_UDP_PORT,
+) -> list[DiscoveredUnit]:
+    """Discover Daikin units, falling back to a subnet sweep if UDP finds none."""
+    found = await async_udp_discover(broadcast_address, udp_port)
+    if not found:
+        if hosts is None:
+            hosts = local_subnet_hosts()
+        _LOGGER.debug("No UDP discovery replies, sweeping ports %s and %s", HTTP_PORT, port)
+        found = await async_sweep(hass, hosts, port)
+
+    return [
+        DiscoveredUnit(ip_address=ip, info=info)
+        for ip, info in sorted(
+            found.items(), key=lambda item: ipaddress.ip_address(item[0])
+        )
+    ]
@@ -0,0 +1,67 @@
+"""Base entity for the Daikin Local integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, format_mac
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import (
+    ATTR_STALE,
+    DOMAIN,
+    SNAPSHOT_BASIC_INFO,
+    SNAPSHOT_CONTROL_INFO,
+    SNAPSHOT_SENSOR_INFO,
+)
+from .coordinator import DaikinCoordinator
+
+
+class DaikinEntity(CoordinatorEntity[DaikinCoordinator]):
+    """Base class for entities backed by a unit's coordinator."""
+
+    def __init__(self, coordinator: DaikinCoordinator, entity_type: str) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        config_entry = coordinator.entry
+        self._config_entry = config_entry
+        self._attr_unique_id = f"{config_entry.entry_id}_{entity_type}"
+        self._attr_name = f"{config_entry.data.get('name', 'Daikin AC')} {entity_type.replace('_', ' ').title()}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, config_entry.entry_id)},
+            "name": config_entry.data.get("name", "Daikin AC"),
+            "manufacturer": "Daikin",
+        }
+        # Static device details belong in the device registry, not in state attributes
+        if firmware := self.basic_info.get("ver"):
+            self._attr_device_info["sw_version"] = firmware.replace("_", ".")
+        if mac := self.basic_info.get("mac"):
+            self._attr_device_info["connections"] = {
+                (CONNECTION_NETWORK_MAC, format_mac(mac))
+            }
+
+    @property
+    def available(self) -> bool:
+        """Return True until the unit has failed FAILURE_THRESHOLD polls in a row."""
+        return self.coordinator.data is not None and self.coordinator.last_update_success
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag state restored from the last known snapshot."""
+        if self.coordinator.stale:
+            return {ATTR_STALE: True}
+        return None
+
+    @property
+    def basic_info(self) -> dict[str, Any]:
+        """Return the latest basic info."""
+        return (self.coordinator.data or {}).get(SNAPSHOT_BASIC_INFO, {})
+
+    @property
+    def control_info(self) -> dict[str, Any]:
+        """Return the latest control info."""
+        return (self.coordinator.data or {}).get(SNAPSHOT_CONTROL_INFO, {})
+
+    @property
+    def sensor_info(self) -> dict[str, Any]:
+        """Return the latest sensor info."""
+        return (self.coordinator.data or {}).get(SNAPSHOT_SENSOR_INFO, {})
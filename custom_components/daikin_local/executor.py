@@ -0,0 +1,151 @@
+"""Dedicated thread pool for blocking Daikin I/O."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+import time
+from typing import Any, TypeVar
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import DATA_EXECUTOR, EXECUTOR_MAX_QUEUE, EXECUTOR_WORKERS
+from .profiler import IntegrationProfiler
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class ExecutorSaturated(Exception):
+    """Error to indicate a background job was rejected by a full pool."""
+
+
+class DaikinExecutor:
+    """Small, sized thread pool that keeps hung units away from HA's executor.
+
+    Foreground jobs (control writes) are always queued. Background jobs
+    (polls) are rejected once max_queue jobs are already waiting, so a few
+    stalled units cannot pile up an unbounded backlog.
+    """
+
+    def __init__(self, workers: int, max_queue: int) -> None:
+        """Initialize the pool."""
+        self.workers = workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="daikin_local"
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._peak_queued = 0
+        self._submitted = 0
+        self._started = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        # Set while a profile service call runs
+        self.profiler: IntegrationProfiler | None = None
+        self.unsub_stop: Callable[[], None] = lambda: None
+
+    async def async_run(
+        self, func: Callable[..., _T], *args: Any, background: bool = False
+    ) -> _T:
+        """Run func(*args) in the pool and return its result."""
+        with self._lock:
+            queued = self._pending - self._running
+            if background and queued >= self.max_queue:
+                self._rejected += 1
+                raise ExecutorSaturated(
+                    f"{queued} jobs already waiting for {self.workers} workers"
+                )
+            self._pending += 1
+            self._submitted += 1
+            self._peak_queued = max(self._peak_queued, queued + 1)
+
+        submitted = time.monotonic()
+        started = False
+        abandoned = False
+
+        def job() -> _T:
+            nonlocal started
+            wait = time.monotonic() - submitted
+            with self._lock:
+                if abandoned:
+                    raise asyncio.CancelledError
+                started = True
+                self._started += 1
+                self._running += 1
+                self._wait_total += wait
+                self._wait_max = max(self._wait_max, wait)
+            try:
+                if (profiler := self.profiler) is not None:
+                    return profiler.run(func, *args)
+                return func(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._pending -= 1
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool, job)
+        finally:
+            # A job cancelled or dropped before it started never counts itself out
+            with self._lock:
+                if not started and not abandoned:
+                    abandoned = True
+                    self._pending -= 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth and wait time counters."""
+        with self._lock:
+            started = self._started
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "peak_queued": self._peak_queued,
+                "submitted": self._submitted,
+                "rejected": self._rejected,
+                "avg_wait_ms": round(self._wait_total / started * 1000, 1) if started else 0.0,
+                "max_wait_ms": round(self._wait_max * 1000, 1),
+            }
+
+    def shutdown(self) -> None:
+        """Stop accepting jobs and drop the ones still waiting."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+@callback
+def async_get_executor(hass: HomeAssistant) -> DaikinExecutor:
+    """Return the integration's executor, creating it on first use."""
+    if (executor := hass.data.get(DATA_EXECUTOR)) is not None:
+        return executor
+
+    executor = DaikinExecutor(EXECUTOR_WORKERS, EXECUTOR_MAX_QUEUE)
+
+    @callback
+    def _async_shutdown_on_stop(event: Event) -> None:
+        """Shut the pool down with Home Assistant."""
+        if hass.data.pop(DATA_EXECUTOR, None) is executor:
+            executor.shutdown()
+
+    hass.data[DATA_EXECUTOR] = executor
+    executor.unsub_stop = hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_STOP, _async_shutdown_on_stop
+    )
+    _LOGGER.debug("Started executor with %d workers", EXECUTOR_WORKERS)
+    return executor
+
+
+@callback
+def async_shutdown_executor(hass: HomeAssistant) -> None:
+    """Shut the executor down once the last entry is unloaded."""
+    if (executor := hass.data.pop(DATA_EXECUTOR, None)) is not None:
+        executor.unsub_stop()
+        executor.shutdown()
@@ -0,0 +1,171 @@
+"""Fleet-wide aggregates over the latest readings of every unit."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+from .const import (
+    CLIMATE_MODE_OFF,
+    DAIKIN_MODE_TO_HA,
+    ESTIMATED_FAN_WATTS,
+    ESTIMATED_WATTS_PER_HZ,
+    FLEET_INITIAL_CAPACITY,
+    SNAPSHOT_CONTROL_INFO,
+    SNAPSHOT_SENSOR_INFO,
+)
+
+# Mode code stored for units that are off or in an unknown mode
+_MODE_OFF = -1
+_MODE_CODES = max(DAIKIN_MODE_TO_HA) + 1
+
+
+def _float(data: dict[str, Any], key: str) -> float:
+    """Return a numeric field of a unit response, or NaN if it is missing."""
+    try:
+        return float(data[key])
+    except (KeyError, TypeError, ValueError):
+        return np.nan
+
+
+class FleetAggregator:
+    """Latest readings of all units in NumPy arrays, one slot per unit.
+
+    Each coordinator update overwrites its unit's slot in place. Aggregates
+    are computed in one vectorized pass over all slots the first time they
+    are read after an update, so every fleet sensor shares that pass.
+    Unreachable units stay in their slot but are left out of the aggregates.
+    """
+
+    def __init__(self, capacity: int = FLEET_INITIAL_CAPACITY) -> None:
+        """Initialize an empty fleet."""
+        self._slots: dict[str, int] = {}
+        self._ids: list[str] = []
+        self._online = np.zeros(capacity, dtype=bool)
+        self._temperature = np.full(capacity, np.nan)
+        self._frequency = np.zeros(capacity)
+        self._mode = np.full(capacity, _MODE_OFF, dtype=np.int8)
+        self._aggregates: dict[str, Any] | None = None
+        self._listeners: list[Callable[[], None]] = []
+        # Entry whose sensor platform holds the fleet sensors
+        self.owner: str | None = None
+        # Callback per loaded entry adding the fleet sensors to its platform
+        self._sensor_platforms: dict[str, Callable[[], None]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of units in the fleet."""
+        return len(self._ids)
+
+    def _grow(self) -> None:
+        """Double the capacity of every array."""
+        capacity = len(self._online) * 2
+        for name, fill in (
+            ("_online", False),
+            ("_temperature", np.nan),
+            ("_frequency", 0.0),
+            ("_mode", _MODE_OFF),
+        ):
+            old = getattr(self, name)
+            new = np.full(capacity, fill, dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
+
+    def update(self, unit: str, snapshot: dict[str, dict[str, Any]] | None) -> None:
+        """Store a unit's latest snapshot; None marks it unreachable."""
+        if (slot := self._slots.get(unit)) is None:
+            if len(self._ids) == len(self._online):
+                self._grow()
+            slot = self._slots[unit] = len(self._ids)
+            self._ids.append(unit)
+
+        if snapshot is None:
+            self._online[slot] = False
+        else:
+            control_info = snapshot.get(SNAPSHOT_CONTROL_INFO, {})
+            sensor_info = snapshot.get(SNAPSHOT_SENSOR_INFO, {})
+            mode = _float(control_info, "mode")
+            running = control_info.get("pow") == "1" and mode in DAIKIN_MODE_TO_HA
+            frequency = _float(sensor_info, "cmpfreq")
+            self._online[slot] = True
+            self._temperature[slot] = _float(sensor_info, "htemp")
+            self._frequency[slot] = 0.0 if np.isnan(frequency) else frequency
+            self._mode[slot] = int(mode) if running else _MODE_OFF
+        self._changed()
+
+    def remove(self, unit: str) -> None:
+        """Drop a unit, moving the last slot into its place."""
+        if (slot := self._slots.pop(unit, None)) is None:
+            return
+        last = len(self._ids) - 1
+        if slot != last:
+            moved = self._ids[last]
+            self._ids[slot] = moved
+            self._slots[moved] = slot
+            for array in (self._online, self._temperature, self._frequency, self._mode):
+                array[slot] = array[last]
+        self._ids.pop()
+        self._online[last] = False
+        self._changed()
+
+    def _changed(self) -> None:
+        """Invalidate the aggregates and tell the listeners."""
+        self._aggregates = None
+        for listener in list(self._listeners):
+            listener()
+
+    def add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call listener after every change; returns a function that removes it."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def add_sensor_platform(self, entry_id: str, add_sensors: Callable[[], None]) -> None:
+        """Register an entry's sensor platform; the first one gets the fleet sensors."""
+        self._sensor_platforms[entry_id] = add_sensors
+        if self.owner is None:
+            self.owner = entry_id
+            add_sensors()
+
+    def remove_sensor_platform(self, entry_id: str) -> None:
+        """Forget an unloaded entry's platform, moving the fleet sensors if it held them."""
+        self._sensor_platforms.pop(entry_id, None)
+        if self.owner != entry_id:
+            return
+        self.owner = next(iter(self._sensor_platforms), None)
+        if self.owner is not None:
+            self._sensor_platforms[self.owner]()
+
+    def aggregates(self) -> dict[str, Any]:
+        """Return the fleet aggregates, recomputing them after a change."""
+        if self._aggregates is not None:
+            return self._aggregates
+
+        count = len(self._ids)
+        online = self._online[:count]
+        temperature = np.where(online, self._temperature[:count], np.nan)
+        measured = ~np.isnan(temperature)
+        mode = self._mode[:count]
+        running = online & (mode != _MODE_OFF)
+        per_mode = np.bincount(mode[running], minlength=_MODE_CODES)
+        frequency = np.where(online, self._frequency[:count], 0.0)
+
+        units = {
+            ha_mode: int(per_mode[code]) for code, ha_mode in DAIKIN_MODE_TO_HA.items()
+        }
+        units[CLIMATE_MODE_OFF] = int(online.sum() - running.sum())
+        self._aggregates = {
+            "units": count,
+            "units_online": int(online.sum()),
+            "mean_temperature": (
+                float(temperature[measured].mean()) if measured.any() else None
+            ),
+            "max_temperature": (
+                float(temperature[measured].max()) if measured.any() else None
+            ),
+            "units_per_mode": units,
+            "estimated_power": float(
+                frequency.sum() * ESTIMATED_WATTS_PER_HZ
+                + running.sum() * ESTIMATED_FAN_WATTS
+            ),
+        }
+        return self._aggregates
@@ -0,0 +1,61 @@
+"""On-demand cProfile sessions for the integration's hot paths."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import cProfile
+import pstats
+import threading
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+
+class IntegrationProfiler:
+    """Profile the event loop thread and every job of the integration's pool.
+
+    Coordinator refreshes and entity writes run on the event loop, so one
+    profile is enabled there for the whole session. Transport calls run in
+    the integration's executor, where each job gets its own profile; they are
+    merged when the session is dumped. On Python versions where a profile
+    already sees every thread, a second one cannot be enabled and the job
+    simply runs under the loop's profile.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an idle profiler."""
+        self._loop_profile = cProfile.Profile()
+        self._job_profiles: list[cProfile.Profile] = []
+        self._lock = threading.Lock()
+        self.jobs = 0
+
+    def start(self) -> None:
+        """Start profiling the calling thread; call from the event loop."""
+        self._loop_profile.enable()
+
+    def stop(self) -> None:
+        """Stop profiling the event loop."""
+        self._loop_profile.disable()
+
+    def run(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run an executor job under its own profile."""
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            return func(*args)
+        try:
+            return func(*args)
+        finally:
+            profile.disable()
+            with self._lock:
+                self._job_profiles.append(profile)
+                self.jobs += 1
+
+    def dump(self, path: str) -> None:
+        """Write the merged statistics in pstats format; blocking."""
+        stats = pstats.Stats(self._loop_profile)
+        with self._lock:
+            profiles = list(self._job_profiles)
+        for profile in profiles:
+            stats.add(profile)
+        stats.dump_stats(path)
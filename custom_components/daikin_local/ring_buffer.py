@@ -0,0 +1,146 @@
+"""Fixed-size buffers of recent readings with O(1) rolling statistics."""
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from typing import Any
+
+from .const import SNAPSHOT_CONTROL_INFO, SNAPSHOT_SENSOR_INFO
+
+# Buffered channels: name -> (snapshot section, field)
+CHANNELS = {
+    "temperature": (SNAPSHOT_SENSOR_INFO, "htemp"),
+    "humidity": (SNAPSHOT_SENSOR_INFO, "hhum"),
+    "outdoor_temperature": (SNAPSHOT_SENSOR_INFO, "otemp"),
+    "setpoint": (SNAPSHOT_CONTROL_INFO, "stemp"),
+}
+
+
+class RingBuffer:
+    """Last N (time, value) samples with running sums and min/max deques.
+
+    Mean and the least-squares slope come from running sums; min and max come
+    from monotonic deques of sample numbers. Every operation is O(1), amortized
+    for the deques. The running sums are recomputed once per buffer length so
+    floating point drift cannot accumulate.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize an empty buffer."""
+        self.capacity = capacity
+        self._times = array("d", [0.0] * capacity)
+        self._values = array("d", [0.0] * capacity)
+        self._count = 0
+        self._pushed = 0
+        self._origin: float | None = None
+        self._sum_t = self._sum_v = self._sum_tt = self._sum_tv = 0.0
+        self._min: deque[int] = deque()
+        self._max: deque[int] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of buffered samples."""
+        return self._count
+
+    def push(self, timestamp: float, value: float) -> None:
+        """Add a sample, evicting the oldest one when full."""
+        if self._origin is None:
+            self._origin = timestamp
+        # Times relative to the first sample keep the squared sums small
+        t = timestamp - self._origin
+        index = self._pushed % self.capacity
+        if self._count == self.capacity:
+            old_t, old_v = self._times[index], self._values[index]
+            self._sum_t -= old_t
+            self._sum_v -= old_v
+            self._sum_tt -= old_t * old_t
+            self._sum_tv -= old_t * old_v
+        else:
+            self._count += 1
+        self._times[index] = t
+        self._values[index] = value
+        self._sum_t += t
+        self._sum_v += value
+        self._sum_tt += t * t
+        self._sum_tv += t * value
+
+        sequence = self._pushed
+        self._pushed += 1
+        oldest = self._pushed - self._count
+        while self._min and self._values[self._min[-1] % self.capacity] >= value:
+            self._min.pop()
+        self._min.append(sequence)
+        while self._min[0] < oldest:
+            self._min.popleft()
+        while self._max and self._values[self._max[-1] % self.capacity] <= value:
+            self._max.pop()
+        self._max.append(sequence)
+        while self._max[0] < oldest:
+            self._max.popleft()
+
+        if self._pushed % self.capacity == 0:
+            self._resync()
+
+    def _resync(self) -> None:
+        """Recompute the running sums from the buffered samples."""
+        times = self._times[: self._count]
+        values = self._values[: self._count]
+        self._sum_t = sum(times)
+        self._sum_v = sum(values)
+        self._sum_tt = sum(t * t for t in times)
+        self._sum_tv = sum(t * v for t, v in zip(times, values))
+
+    @property
+    def mean(self) -> float | None:
+        """Return the average of the buffered samples."""
+        return self._sum_v / self._count if self._count else None
+
+    @property
+    def slope(self) -> float | None:
+        """Return the least-squares rate of change per second."""
+        n = self._count
+        if n < 2:
+            return None
+        denominator = n * self._sum_tt - self._sum_t * self._sum_t
+        if denominator <= 0:
+            return None
+        return (n * self._sum_tv - self._sum_t * self._sum_v) / denominator
+
+    @property
+    def minimum(self) -> float | None:
+        """Return the smallest buffered sample."""
+        return self._values[self._min[0] % self.capacity] if self._min else None
+
+    @property
+    def maximum(self) -> float | None:
+        """Return the largest buffered sample."""
+        return self._values[self._max[0] % self.capacity] if self._max else None
+
+
+class ReadingBuffers:
+    """One ring buffer per channel of a unit's polled readings."""
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize empty buffers."""
+        self.buffers = {name: RingBuffer(capacity) for name in CHANNELS}
+
+    def update(self, snapshot: dict[str, dict[str, Any]], now: float) -> None:
+        """Buffer the readings of one poll; missing or non-numeric ones are skipped."""
+        for name, (section, field) in CHANNELS.items():
+            try:
+                value = float(snapshot.get(section, {})[field])
+            except (KeyError, TypeError, ValueError):
+                continue
+            self.buffers[name].push(now, value)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return the rolling statistics of every channel."""
+        return {
+            name: {
+                "samples": len(buffer),
+                "mean": buffer.mean,
+                "slope_per_min": None if buffer.slope is None else buffer.slope * 60,
+                "min": buffer.minimum,
+                "max": buffer.maximum,
+            }
+            for name, buffer in self.buffers.items()
+        }
@@ -2,19 +2,69 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTemperature, PERCENTAGE
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    EntityCategory,
+    UnitOfPower,
+    UnitOfTemperature,
+    UnitOfTime,
+    PERCENTAGE,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
-from .daikin_client import DaikinClient
+from .const import (
+    CLIMATE_MODE_OFF,
+    CONF_HUMIDITY_DEADBAND,
+    CONF_MAX_PUBLISH_INTERVAL,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_TEMPERATURE_DEADBAND,
+    DAIKIN_MODE_TO_HA,
+    DATA_FLEET,
+    DEFAULT_HUMIDITY_DEADBAND,
+    DEFAULT_MAX_PUBLISH_INTERVAL,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DOMAIN,
+)
+from .coordinator import DaikinCoordinator
+from .entity import DaikinEntity
+from .fleet import FleetAggregator
 
 _LOGGER = logging.getLogger(__name__)
 
+STAT_MEAN = "average"
+STAT_RATE = "rate"
+STAT_MIN = "min"
+STAT_MAX = "max"
+
+# Rolling statistics sensors: (channel, statistic, unit, enabled by default)
+ROLLING_SENSORS = (
+    ("temperature", STAT_MEAN, UnitOfTemperature.CELSIUS, True),
+    ("temperature", STAT_RATE, "°C/min", True),
+    ("temperature", STAT_MIN, UnitOfTemperature.CELSIUS, False),
+    ("temperature", STAT_MAX, UnitOfTemperature.CELSIUS, False),
+    ("humidity", STAT_MEAN, PERCENTAGE, False),
+    ("humidity", STAT_RATE, "%/min", False),
+    ("outdoor_temperature", STAT_MEAN, UnitOfTemperature.CELSIUS, False),
+    ("outdoor_temperature", STAT_MIN, UnitOfTemperature.CELSIUS, False),
+    ("outdoor_temperature", STAT_MAX, UnitOfTemperature.CELSIUS, False),
+    ("setpoint", STAT_MIN, UnitOfTemperature.CELSIUS, False),
+    ("setpoint", STAT_MAX, UnitOfTemperature.CELSIUS, False),
+)
+
+# Fleet sensors: (aggregate, unit, device class)
+FLEET_SENSORS = (
+    ("mean_temperature", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE),
+    ("max_temperature", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE),
+    ("units_online", None, None),
+    ("estimated_power", UnitOfPower.WATT, SensorDeviceClass.POWER),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -22,142 +72,311 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Daikin Local sensors based on a config entry."""
-    client: DaikinClient = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: DaikinCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     
     entities = [
-        DaikinTemperatureSensor(client, config_entry),
-        DaikinHumiditySensor(client, config_entry),
-        DaikinErrorStatusSensor(client, config_entry),
-        DaikinFirmwareVersionSensor(client, config_entry),
+        DaikinTemperatureSensor(coordinator),
+        DaikinHumiditySensor(coordinator),
+        DaikinErrorStatusSensor(coordinator),
+        DaikinFirmwareVersionSensor(coordinator),
+        DaikinTimeToSetpointSensor(coordinator),
+        DaikinHeatLossRateSensor(coordinator),
     ]
-    
+    entities.extend(
+        DaikinRollingSensor(coordinator, *description) for description in ROLLING_SENSORS
+    )
+
     async_add_entities(entities)
 
+    # One entry's platform holds the fleet sensors; when that entry unloads
+    # they are added to another loaded entry's platform
+    fleet: FleetAggregator = hass.data[DATA_FLEET]
+
+    @callback
+    def _async_add_fleet_sensors() -> None:
+        """Add the fleet sensors to this entry's platform."""
+        fleet_entities: list[SensorEntity] = [
+            DaikinFleetSensor(fleet, *description) for description in FLEET_SENSORS
+        ]
+        fleet_entities.extend(
+            DaikinFleetModeSensor(fleet, mode)
+            for mode in (*DAIKIN_MODE_TO_HA.values(), CLIMATE_MODE_OFF)
+        )
+        async_add_entities(fleet_entities)
+
+    fleet.add_sensor_platform(config_entry.entry_id, _async_add_fleet_sensors)
+
 
-class DaikinBaseSensor(SensorEntity):
+class DaikinBaseSensor(DaikinEntity, SensorEntity):
     """Base class for Daikin sensors."""
 
-    def __init__(self, client: DaikinClient, config_entry: ConfigEntry, sensor_type: str) -> None:
-        """Initialize the sensor."""
-        self._client = client
-        self._config_entry = config_entry
-        self._attr_unique_id = f"{config_entry.entry_id}_{sensor_type}"
-        self._attr_name = f"{config_entry.data.get('name', 'Daikin AC')} {sensor_type.replace('_', ' ').title()}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": config_entry.data.get("name", "Daikin AC"),
-            "manufacturer": "Daikin",
-        }
-        self._attr_should_poll = True
 
+class DaikinFilteredSensor(DaikinBaseSensor):
+    """Numeric sensor that only publishes meaningful changes.
+
+    A new reading is written to the state machine when it moves more than the
+    deadband away from the last published value and at least the minimum
+    interval has passed. The current reading is always published once the
+    maximum interval has passed, so long-term statistics keep getting samples.
+    """
+
+    # Field of the unit's sensor info holding the reading
+    _sensor_key: str
+    _deadband_option: str
+    _default_deadband: float
+
+    def __init__(self, coordinator: DaikinCoordinator, sensor_type: str) -> None:
+        """Initialize the filtered sensor."""
+        super().__init__(coordinator, sensor_type)
+        options = self._config_entry.options
+        self._deadband = options.get(self._deadband_option, self._default_deadband)
+        self._min_interval = options.get(
+            CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL
+        )
+        self._max_interval = options.get(
+            CONF_MAX_PUBLISH_INTERVAL, DEFAULT_MAX_PUBLISH_INTERVAL
+        )
+        self._attr_native_value = self._read_value()
+        self._published_at = time.monotonic()
+        self._published_available = self.available
+        self._published_stale = self.coordinator.stale
+
+    def _read_value(self) -> float | None:
+        """Return the latest reading from the coordinator snapshot."""
+        try:
+            return float(self.sensor_info[self._sensor_key])
+        except (KeyError, ValueError):
+            return None
 
-class DaikinTemperatureSensor(DaikinBaseSensor):
+    def _should_publish(self, value: float | None, now: float) -> bool:
+        """Return True if a reading should be written to the state machine."""
+        if (
+            self.available != self._published_available
+            or self.coordinator.stale != self._published_stale
+        ):
+            return True
+
+        published = self._attr_native_value
+        if value is None or published is None:
+            return value != published
+
+        elapsed = now - self._published_at
+        if elapsed >= self._max_interval:
+            return True
+        if elapsed < self._min_interval:
+            return False
+        return abs(value - published) > self._deadband
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Publish the new reading if it passes the deadband and interval checks."""
+        value = self._read_value()
+        now = time.monotonic()
+        if not self._should_publish(value, now):
+            return
+
+        self._attr_native_value = value
+        self._published_at = now
+        self._published_available = self.available
+        self._published_stale = self.coordinator.stale
+        super()._handle_coordinator_update()
+
+
+class DaikinTemperatureSensor(DaikinFilteredSensor):
     """Representation of a Daikin temperature sensor."""
 
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _sensor_key = "htemp"
+    _deadband_option = CONF_TEMPERATURE_DEADBAND
+    _default_deadband = DEFAULT_TEMPERATURE_DEADBAND
 
-    def __init__(self, client: DaikinClient, config_entry: ConfigEntry) -> None:
+    def __init__(self, coordinator: DaikinCoordinator) -> None:
         """Initialize the temperature sensor."""
-        super().__init__(client, config_entry, "temperature")
-        self._attr_name = f"{config_entry.data.get('name', 'Daikin AC')} Temperature"
+        super().__init__(coordinator, "temperature")
+        self._attr_name = f"{self._config_entry.data.get('name', 'Daikin AC')} Temperature"
 
-    async def async_update(self) -> None:
-        """Update the sensor state."""
-        try:
-            sensor_info = await self.hass.async_add_executor_job(
-                self._client.get_sensor_info
-            )
-            
-            if "htemp" in sensor_info:
-                self._attr_native_value = float(sensor_info["htemp"])
-            else:
-                self._attr_native_value = None
-                
-        except Exception as err:
-            _LOGGER.error("Failed to update temperature sensor: %s", err)
-            self._attr_native_value = None
-
-
-class DaikinHumiditySensor(DaikinBaseSensor):
+
+class DaikinHumiditySensor(DaikinFilteredSensor):
     """Representation of a Daikin humidity sensor."""
 
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_device_class = SensorDeviceClass.HUMIDITY
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _sensor_key = "hhum"
+    _deadband_option = CONF_HUMIDITY_DEADBAND
+    _default_deadband = DEFAULT_HUMIDITY_DEADBAND
 
-    def __init__(self, client: DaikinClient, config_entry: ConfigEntry) -> None:
+    def __init__(self, coordinator: DaikinCoordinator) -> None:
         """Initialize the humidity sensor."""
-        super().__init__(client, config_entry, "humidity")
-        self._attr_name = f"{config_entry.data.get('name', 'Daikin AC')} Humidity"
-
-    async def async_update(self) -> None:
-        """Update the sensor state."""
-        try:
-            sensor_info = await self.hass.async_add_executor_job(
-                self._client.get_sensor_info
-            )
-            
-            if "hhum" in sensor_info:
-                self._attr_native_value = float(sensor_info["hhum"])
-            else:
-                self._attr_native_value = None
-                
-        except Exception as err:
-            _LOGGER.error("Failed to update humidity sensor: %s", err)
-            self._attr_native_value = None
+        super().__init__(coordinator, "humidity")
+        self._attr_name = f"{self._config_entry.data.get('name', 'Daikin AC')} Humidity"
 
 
 class DaikinErrorStatusSensor(DaikinBaseSensor):
     """Representation of a Daikin error status sensor."""
 
-    def __init__(self, client: DaikinClient, config_entry: ConfigEntry) -> None:
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator: DaikinCoordinator) -> None:
         """Initialize the error status sensor."""
-        super().__init__(client, config_entry, "error_status")
-        self._attr_name = f"{config_entry.data.get('name', 'Daikin AC')} Error Status"
+        super().__init__(coordinator, "error_status")
+        self._attr_name = f"{self._config_entry.data.get('name', 'Daikin AC')} Error Status"
 
-    async def async_update(self) -> None:
-        """Update the sensor state."""
-        try:
-            basic_info = await self.hass.async_add_executor_job(
-                self._client.get_basic_info
-            )
-            
-            if "err" in basic_info:
-                error_code = basic_info["err"]
-                if error_code == "0":
-                    self._attr_native_value = "No Error"
-                else:
-                    self._attr_native_value = f"Error Code: {error_code}"
-            else:
-                self._attr_native_value = "Unknown"
-                
-        except Exception as err:
-            _LOGGER.error("Failed to update error status sensor: %s", err)
-            self._attr_native_value = "Connection Error"
+    @property
+    def native_value(self) -> str:
+        """Return the error status."""
+        if "err" not in self.basic_info:
+            return "Unknown"
+        error_code = self.basic_info["err"]
+        if error_code == "0":
+            return "No Error"
+        return f"Error Code: {error_code}"
 
 
 class DaikinFirmwareVersionSensor(DaikinBaseSensor):
     """Representation of a Daikin firmware version sensor."""
 
-    def __init__(self, client: DaikinClient, config_entry: ConfigEntry) -> None:
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator: DaikinCoordinator) -> None:
         """Initialize the firmware version sensor."""
-        super().__init__(client, config_entry, "firmware_version")
-        self._attr_name = f"{config_entry.data.get('name', 'Daikin AC')} Firmware Version"
+        super().__init__(coordinator, "firmware_version")
+        self._attr_name = f"{self._config_entry.data.get('name', 'Daikin AC')} Firmware Version"
 
-    async def async_update(self) -> None:
-        """Update the sensor state."""
-        try:
-            basic_info = await self.hass.async_add_executor_job(
-                self._client.get_basic_info
-            )
-            
-            if "ver" in basic_info:
-                self._attr_native_value = basic_info["ver"]
-            else:
-                self._attr_native_value = "Unknown"
-                
-        except Exception as err:
-            _LOGGER.error("Failed to update firmware version sensor: %s", err)
-            self._attr_native_value = "Unknown"
+    @property
+    def native_value(self) -> str:
+        """Return the firmware version."""
+        return self.basic_info.get("ver", "Unknown")
+
+
+class DaikinTimeToSetpointSensor(DaikinBaseSensor):
+    """Predicted minutes to reach the setpoint if the unit runs from now on."""
+
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator: DaikinCoordinator) -> None:
+        """Initialize the time to setpoint sensor."""
+        super().__init__(coordinator, "time_to_setpoint")
+        self._attr_name = f"{self._config_entry.data.get('name', 'Daikin AC')} Time To Setpoint"
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the predicted time to setpoint, unknown until the model is trained."""
+        minutes = self.coordinator.thermal.time_to_setpoint()
+        return None if minutes is None else round(minutes)
+
+
+class DaikinHeatLossRateSensor(DaikinBaseSensor):
+    """Rate at which the room drifts towards the outdoor temperature."""
+
+    _attr_native_unit_of_measurement = "°C/h"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator: DaikinCoordinator) -> None:
+        """Initialize the heat loss rate sensor."""
+        super().__init__(coordinator, "heat_loss_rate")
+        self._attr_name = f"{self._config_entry.data.get('name', 'Daikin AC')} Heat Loss Rate"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the heat loss rate, unknown until the model is trained."""
+        rate = self.coordinator.thermal.heat_loss_rate
+        return None if rate is None else round(rate, 1)
+
+
+class DaikinRollingSensor(DaikinBaseSensor):
+    """Rolling statistic over the unit's last RING_BUFFER_SIZE readings."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: DaikinCoordinator,
+        channel: str,
+        statistic: str,
+        unit: str,
+        enabled_default: bool,
+    ) -> None:
+        """Initialize the rolling statistic sensor."""
+        super().__init__(coordinator, f"{channel}_{statistic}")
+        self._buffer = coordinator.readings.buffers[channel]
+        self._statistic = statistic
+        self._attr_native_unit_of_measurement = unit
+        self._attr_entity_registry_enabled_default = enabled_default
+        if unit == UnitOfTemperature.CELSIUS:
+            self._attr_device_class = SensorDeviceClass.TEMPERATURE
+        elif unit == PERCENTAGE:
+            self._attr_device_class = SensorDeviceClass.HUMIDITY
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the statistic, unknown until there are enough readings."""
+        buffer = self._buffer
+        if self._statistic == STAT_MEAN:
+            value = buffer.mean
+        elif self._statistic == STAT_RATE:
+            value = None if buffer.slope is None else buffer.slope * 60
+        elif self._statistic == STAT_MIN:
+            value = buffer.minimum
+        else:
+            value = buffer.maximum
+        if value is None:
+            return None
+        return round(value, 3 if self._statistic == STAT_RATE else 1)
+
+
+class DaikinFleetSensor(SensorEntity):
+    """Aggregate over the latest readings of all configured units."""
+
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        fleet: FleetAggregator,
+        aggregate: str,
+        unit: str | None = None,
+        device_class: SensorDeviceClass | None = None,
+    ) -> None:
+        """Initialize the fleet sensor."""
+        self._fleet = fleet
+        self._aggregate = aggregate
+        self._attr_unique_id = f"{DOMAIN}_fleet_{aggregate}"
+        self._attr_name = f"Daikin Fleet {aggregate.replace('_', ' ').title()}"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_device_class = device_class
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, "fleet")},
+            "name": "Daikin Fleet",
+            "manufacturer": "Daikin",
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Write the state whenever a unit's readings change."""
+        self.async_on_remove(self._fleet.add_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the aggregate, unknown while no unit reports it."""
+        value = self._fleet.aggregates()[self._aggregate]
+        if isinstance(value, float):
+            return round(value, 1)
+        return value
+
+
+class DaikinFleetModeSensor(DaikinFleetSensor):
+    """Number of reachable units running in one mode, or off."""
+
+    def __init__(self, fleet: FleetAggregator, mode: str) -> None:
+        """Initialize the units per mode sensor."""
+        super().__init__(fleet, f"units_{mode}")
+        self._mode = mode
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of units in the mode."""
+        return self._fleet.aggregates()["units_per_mode"][self._mode]
@@ -0,0 +1,197 @@
+"""Services for the Daikin Local integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_TEMPERATURE
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_DURATION,
+    ATTR_FAN_MODE,
+    ATTR_FORCE,
+    ATTR_HVAC_MODE,
+    ATTR_SWING,
+    CLIMATE_MODE_OFF,
+    DEFAULT_PROFILE_DURATION,
+    DOMAIN,
+    GROUP_CONCURRENCY,
+    HA_FAN_TO_DAIKIN,
+    HA_MODE_TO_DAIKIN,
+    MAX_PROFILE_DURATION,
+    MAX_TEMP,
+    MIN_TEMP,
+    SERVICE_PROFILE,
+    SERVICE_SET_GROUP,
+)
+from .coordinator import DaikinCoordinator
+from .executor import async_get_executor
+from .profiler import IntegrationProfiler
+
+_LOGGER = logging.getLogger(__name__)
+
+SET_GROUP_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+            vol.Optional(ATTR_HVAC_MODE): vol.In(
+                [CLIMATE_MODE_OFF, *HA_MODE_TO_DAIKIN]
+            ),
+            vol.Optional(ATTR_TEMPERATURE): vol.All(
+                vol.Coerce(float), vol.Range(min=MIN_TEMP, max=MAX_TEMP)
+            ),
+            vol.Optional(ATTR_FAN_MODE): vol.In(list(HA_FAN_TO_DAIKIN)),
+            vol.Optional(ATTR_SWING): cv.boolean,
+            vol.Optional(ATTR_FORCE, default=False): cv.boolean,
+        }
+    ),
+    cv.has_at_least_one_key(
+        ATTR_HVAC_MODE, ATTR_TEMPERATURE, ATTR_FAN_MODE, ATTR_SWING
+    ),
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=MAX_PROFILE_DURATION)
+        ),
+    }
+)
+
+
+def _control_changes(data: dict[str, Any]) -> dict[str, str]:
+    """Translate service fields into set_control_info parameters."""
+    changes: dict[str, str] = {}
+    if (hvac_mode := data.get(ATTR_HVAC_MODE)) is not None:
+        if hvac_mode == CLIMATE_MODE_OFF:
+            changes["pow"] = "0"
+        else:
+            changes["pow"] = "1"
+            changes["mode"] = str(HA_MODE_TO_DAIKIN[hvac_mode])
+    if (temperature := data.get(ATTR_TEMPERATURE)) is not None:
+        changes["stemp"] = str(temperature)
+    if (fan_mode := data.get(ATTR_FAN_MODE)) is not None:
+        changes["f_rate"] = HA_FAN_TO_DAIKIN[fan_mode]
+    if (swing := data.get(ATTR_SWING)) is not None:
+        changes["f_dir"] = "1" if swing else "0"
+    return changes
+
+
+async def _async_set_group(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Apply the same control settings to many units concurrently."""
+    changes = _control_changes(call.data)
+    registry = er.async_get(hass)
+    semaphore = asyncio.Semaphore(GROUP_CONCURRENCY)
+
+    async def apply(entity_id: str) -> dict[str, Any]:
+        entity_entry = registry.async_get(entity_id)
+        coordinator: DaikinCoordinator | None = None
+        if entity_entry is not None and entity_entry.platform == DOMAIN:
+            coordinator = hass.data[DOMAIN].get(entity_entry.config_entry_id)
+        if coordinator is None:
+            return {"success": False, "error": "not a Daikin Local entity"}
+
+        async with semaphore:
+            start = time.monotonic()
+            try:
+                success = await coordinator.async_update_control(
+                    force=call.data[ATTR_FORCE], **changes
+                )
+                error = None
+            except Exception as err:  # pylint: disable=broad-except
+                success = False
+                error = str(err)
+            latency = round((time.monotonic() - start) * 1000)
+
+        result: dict[str, Any] = {"success": success, "latency_ms": latency}
+        if error:
+            result["error"] = error
+        return result
+
+    entity_ids: list[str] = call.data[ATTR_ENTITY_ID]
+    results = await asyncio.gather(*(apply(entity_id) for entity_id in entity_ids))
+    failed = [
+        entity_id
+        for entity_id, result in zip(entity_ids, results)
+        if not result["success"]
+    ]
+    if failed:
+        _LOGGER.warning("Group command failed for %s", ", ".join(failed))
+
+    return {"units": dict(zip(entity_ids, results))}
+
+
+async def _async_profile(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Profile the event loop and the integration's executor jobs for a while."""
+    executor = async_get_executor(hass)
+    if executor.profiler is not None:
+        raise HomeAssistantError("A Daikin Local profile is already running")
+
+    duration: float = call.data[ATTR_DURATION]
+    path = hass.config.path(f"{DOMAIN}_profile_{dt_util.now():%Y%m%d_%H%M%S}.prof")
+    profiler = IntegrationProfiler()
+    try:
+        profiler.start()
+    except ValueError as err:
+        # Python 3.12+ allows only one active profile, e.g. the profiler integration's
+        raise HomeAssistantError(f"Cannot start profiling: {err}") from err
+    _LOGGER.info("Profiling for %s seconds", duration)
+    try:
+        executor.profiler = profiler
+        await asyncio.sleep(duration)
+    finally:
+        profiler.stop()
+        executor.profiler = None
+
+    await hass.async_add_executor_job(profiler.dump, path)
+    _LOGGER.info("Wrote profile with %d executor jobs to %s", profiler.jobs, path)
+    return {"path": path, "executor_jobs": profiler.jobs}
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+    if hass.services.has_service(DOMAIN, SERVICE_SET_GROUP):
+        return
+
+    async def handle_set_group(call: ServiceCall) -> ServiceResponse:
+        return await _async_set_group(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_GROUP,
+        handle_set_group,
+        schema=SET_GROUP_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def handle_profile(call: ServiceCall) -> ServiceResponse:
+        return await _async_profile(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        handle_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the integration services once the last entry is unloaded."""
+    if hass.data.get(DOMAIN):
+        return
+    hass.services.async_remove(DOMAIN, SERVICE_SET_GROUP)
+    hass.services.async_remove(DOMAIN, SERVICE_PROFILE)
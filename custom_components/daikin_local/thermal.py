@@ -0,0 +1,196 @@
+"""Online thermal model of a room conditioned by a Daikin unit.
+
+The room temperature T is modelled as
+
+    dT/dt = a * (To - T) + b_heat * heating + b_cool * cooling
+
+with To the outdoor temperature and heating/cooling 1 while the unit runs in
+that mode, else 0. a is the envelope's loss coefficient (1/h) and b_heat and
+b_cool the unit's heating and cooling rates (degC/h). The parameters are
+fitted by recursive least squares with exponential forgetting, which costs
+O(1) per sample and keeps no history beyond the previous sample.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+from .const import (
+    CLIMATE_MODE_AUTO,
+    CLIMATE_MODE_COOL,
+    CLIMATE_MODE_HEAT,
+    DAIKIN_MODE_TO_HA,
+    SNAPSHOT_CONTROL_INFO,
+    SNAPSHOT_SENSOR_INFO,
+    THERMAL_FORGETTING,
+    THERMAL_MAX_GAP,
+    THERMAL_MIN_SAMPLES,
+)
+
+# Initial parameter uncertainty, and the bound that stops P winding up while
+# a regressor is not excited (e.g. no heating for days)
+_INITIAL_COVARIANCE = 1000.0
+_MAX_COVARIANCE_TRACE = 1e5
+# Tolerance on the setpoint that counts as reached, in degC
+_SETPOINT_TOLERANCE = 0.25
+
+
+def _float(data: dict[str, Any], key: str) -> float | None:
+    """Return a numeric field of a unit response, or None if it is missing."""
+    try:
+        return float(data[key])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _drive(mode: str | None, temperature: float, setpoint: float) -> tuple[float, float]:
+    """Return the (heating, cooling) regressors for a mode at a temperature."""
+    if mode == CLIMATE_MODE_AUTO:
+        mode = CLIMATE_MODE_HEAT if temperature < setpoint else CLIMATE_MODE_COOL
+    if mode == CLIMATE_MODE_HEAT:
+        return 1.0, 0.0
+    if mode == CLIMATE_MODE_COOL:
+        return 0.0, 1.0
+    return 0.0, 0.0
+
+
+class ThermalModel:
+    """Recursive least squares fit of the room's thermal response."""
+
+    def __init__(self, forgetting: float = THERMAL_FORGETTING) -> None:
+        """Initialize an untrained model."""
+        self.forgetting = forgetting
+        self.samples = 0
+        self.theta = [0.0, 0.0, 0.0]
+        self.covariance = [
+            [_INITIAL_COVARIANCE if row == col else 0.0 for col in range(3)]
+            for row in range(3)
+        ]
+        self.indoor: float | None = None
+        self.outdoor: float | None = None
+        self.setpoint: float | None = None
+        self.mode: str | None = None
+        self._previous: tuple[float, float, list[float]] | None = None
+
+    @property
+    def loss_coefficient(self) -> float:
+        """Return a, the fraction of the indoor-outdoor gap closed per hour."""
+        return self.theta[0]
+
+    @property
+    def trained(self) -> bool:
+        """Return True once the fit has seen enough samples to be used."""
+        return self.samples >= THERMAL_MIN_SAMPLES and self.loss_coefficient > 0
+
+    def update(self, snapshot: dict[str, dict[str, Any]], now: float) -> None:
+        """Feed one poll, with now in seconds on a monotonic clock."""
+        sensor_info = snapshot.get(SNAPSHOT_SENSOR_INFO, {})
+        control_info = snapshot.get(SNAPSHOT_CONTROL_INFO, {})
+        indoor = _float(sensor_info, "htemp")
+        outdoor = _float(sensor_info, "otemp")
+        setpoint = _float(control_info, "stemp")
+        try:
+            mode = DAIKIN_MODE_TO_HA.get(int(control_info["mode"]))
+        except (KeyError, ValueError):
+            mode = None
+        powered = control_info.get("pow") == "1"
+
+        self.indoor, self.outdoor, self.setpoint, self.mode = indoor, outdoor, setpoint, mode
+        if indoor is None or outdoor is None:
+            self._previous = None
+            return
+
+        heating, cooling = (
+            _drive(mode, indoor, setpoint if setpoint is not None else indoor)
+            if powered
+            else (0.0, 0.0)
+        )
+        regressors = [outdoor - indoor, heating, cooling]
+
+        if self._previous is not None:
+            previous_time, previous_indoor, previous_regressors = self._previous
+            elapsed = now - previous_time
+            if 0 < elapsed <= THERMAL_MAX_GAP:
+                rate = (indoor - previous_indoor) / (elapsed / 3600)
+                self._fit(previous_regressors, rate)
+        self._previous = (now, indoor, regressors)
+
+    def _fit(self, x: list[float], y: float) -> None:
+        """Apply one recursive least squares step for y = theta . x."""
+        p = self.covariance
+        px = [sum(p[row][col] * x[col] for col in range(3)) for row in range(3)]
+        denominator = self.forgetting + sum(x[row] * px[row] for row in range(3))
+        gain = [value / denominator for value in px]
+        error = y - sum(self.theta[row] * x[row] for row in range(3))
+        self.theta = [self.theta[row] + gain[row] * error for row in range(3)]
+
+        # Only forget while P is bounded, so unexcited directions cannot wind up
+        trace = sum(p[row][row] for row in range(3))
+        scale = 1 / self.forgetting if trace < _MAX_COVARIANCE_TRACE else 1.0
+        self.covariance = [
+            [(p[row][col] - gain[row] * px[col]) * scale for col in range(3)]
+            for row in range(3)
+        ]
+        self.samples += 1
+
+    @property
+    def heat_loss_rate(self) -> float | None:
+        """Return how fast the room drifts towards outdoors, in degC/h.
+
+        Positive while the room loses heat, negative while it gains heat.
+        """
+        if not self.trained or self.indoor is None or self.outdoor is None:
+            return None
+        return self.loss_coefficient * (self.indoor - self.outdoor)
+
+    def time_to_setpoint(self) -> float | None:
+        """Return the predicted minutes to reach the setpoint in the current mode.
+
+        The prediction assumes the unit runs from now on, whether or not it is
+        on, so automations can start it just in time. Returns 0 when the
+        setpoint is already reached and None when it cannot be reached.
+        """
+        if (
+            not self.trained
+            or self.indoor is None
+            or self.outdoor is None
+            or self.setpoint is None
+        ):
+            return None
+
+        indoor, setpoint = self.indoor, self.setpoint
+        heating, cooling = _drive(self.mode, indoor, setpoint)
+        if not heating and not cooling:
+            return None
+        if (heating and indoor >= setpoint - _SETPOINT_TOLERANCE) or (
+            cooling and indoor <= setpoint + _SETPOINT_TOLERANCE
+        ):
+            return 0.0
+
+        a, b_heat, b_cool = self.theta
+        drive = b_heat * heating + b_cool * cooling
+        # T approaches equilibrium exponentially with time constant 1/a
+        equilibrium = self.outdoor + drive / a
+        ratio = (setpoint - equilibrium) / (indoor - equilibrium)
+        if not 0 < ratio < 1:
+            return None
+        return -math.log(ratio) / a * 60
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the fitted parameters in a JSON serializable form."""
+        return {
+            "samples": self.samples,
+            "theta": self.theta,
+            "covariance": self.covariance,
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore parameters saved with as_dict."""
+        try:
+            theta = [float(value) for value in data["theta"]]
+            covariance = [[float(value) for value in row] for row in data["covariance"]]
+            samples = int(data["samples"])
+        except (KeyError, TypeError, ValueError):
+            return
+        if len(theta) == 3 and len(covariance) == 3 and all(len(row) == 3 for row in covariance):
+            self.theta, self.covariance, self.samples = theta, covariance, samples
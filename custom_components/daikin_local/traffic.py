@@ -0,0 +1,131 @@
+"""Record and replay Daikin traffic through a client's transport seam."""
+from collections import defaultdict, deque
+import json
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+REDACTED = "**REDACTED**"
+# Parameters that must never end up in a fixture file
+REDACT_PARAMS = {"key"}
+
+
+def load_fixture(path: str) -> List[Dict[str, Any]]:
+    """Load the exchanges of a JSON-lines fixture, ordered by recording time."""
+    exchanges = []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                exchanges.append(json.loads(line))
+    exchanges.sort(key=lambda exchange: exchange["t"])
+    return exchanges
+
+
+class TrafficRecorder:
+    """Append every exchange of one or more clients to a JSON-lines fixture.
+
+    Each line holds the unit, endpoint, redacted params, raw body or error,
+    the time since recording started and how long the exchange took.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open the fixture for appending."""
+        self.path = path
+        self.recorded = 0
+        self._file = open(path, "a")
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+
+    def attach(self, client, unit: Optional[str] = None) -> None:
+        """Record every request the client makes from now on."""
+        inner = client.transport
+        unit = unit or client.ip_address
+
+        def recording_transport(endpoint: str, params: Dict[str, Any], deadline: float) -> str:
+            start = time.monotonic()
+            exchange = {
+                "t": round(start - self._start, 4),
+                "unit": unit,
+                "endpoint": endpoint,
+                "params": {
+                    name: REDACTED if name in REDACT_PARAMS else value
+                    for name, value in params.items()
+                },
+            }
+            try:
+                body = inner(endpoint, params, deadline)
+            except Exception as err:
+                exchange["error"] = str(err)
+                raise
+            else:
+                exchange["body"] = body
+                exchange["profile"] = client.last_profile
+                return body
+            finally:
+                exchange["elapsed"] = round(time.monotonic() - start, 4)
+                self._write(exchange)
+
+        client.transport = recording_transport
+
+    def _write(self, exchange: Dict[str, Any]) -> None:
+        """Append one exchange, flushed so a crash keeps what was captured."""
+        with self._lock:
+            self._file.write(json.dumps(exchange, separators=(",", ":")) + "\n")
+            self._file.flush()
+            self.recorded += 1
+
+    def close(self) -> None:
+        """Close the fixture file."""
+        with self._lock:
+            self._file.close()
+
+
+class ReplayTransport:
+    """Fake transport answering from recorded exchanges.
+
+    Requests are matched to the next recorded exchange of the same endpoint.
+    Each answer is delayed by its recorded duration divided by speed (0 for no
+    delay) and recorded errors are raised again, so firmware quirks and
+    timeouts reproduce without the unit. With loop=True an endpoint's
+    exchanges start over once used up.
+    """
+
+    def __init__(
+        self,
+        exchanges: Iterable[Dict[str, Any]],
+        speed: float = 1.0,
+        loop: bool = False,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the transport."""
+        self.speed = speed
+        self.loop = loop
+        self.replayed = 0
+        self._sleep = sleep
+        self._queues: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        for exchange in exchanges:
+            self._queues[exchange["endpoint"]].append(exchange)
+        self._lock = threading.Lock()
+
+    def __call__(self, endpoint: str, params: Dict[str, Any], deadline: float) -> str:
+        """Answer a request with the next recorded exchange of its endpoint."""
+        with self._lock:
+            queue = self._queues.get(endpoint)
+            if not queue:
+                raise Exception(f"No recorded exchange left for {endpoint}")
+            exchange = queue.popleft()
+            if self.loop:
+                queue.append(exchange)
+            self.replayed += 1
+
+        if self.speed:
+            delay = exchange.get("elapsed", 0.0) / self.speed
+            remaining = deadline - time.monotonic()
+            if delay > remaining:
+                self._sleep(max(0.0, remaining))
+                raise Exception(f"Replayed {endpoint} exceeded the request deadline")
+            self._sleep(delay)
+
+        if "error" in exchange:
+            raise Exception(exchange["error"])
+        return exchange["body"]
@@ -0,0 +1,85 @@
+"""Read-only HTTP view serving the cached unit snapshots."""
+from __future__ import annotations
+
+from email.utils import format_datetime
+from http import HTTPStatus
+
+from aiohttp import web
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DATA_VIEW,
+    DEFAULT_SCAN_INTERVAL,
+    SNAPSHOT_BASIC_INFO,
+    SNAPSHOT_CONTROL_INFO,
+    SNAPSHOT_SENSOR_INFO,
+)
+from .coordinator import DaikinCoordinator, find_coordinator
+
+SECTIONS = (SNAPSHOT_BASIC_INFO, SNAPSHOT_CONTROL_INFO, SNAPSHOT_SENSOR_INFO)
+
+
+def _freshness_headers(coordinator: DaikinCoordinator) -> dict[str, str]:
+    """Return headers telling consumers how old the snapshot is."""
+    stale = coordinator.stale or not coordinator.last_update_success
+    headers = {"X-Daikin-Stale": "1" if stale else "0"}
+    if (updated := coordinator.last_updated) is None:
+        headers["Cache-Control"] = "no-cache"
+        return headers
+
+    age = max(0, int((dt_util.utcnow() - updated).total_seconds()))
+    headers["Last-Modified"] = format_datetime(updated, usegmt=True)
+    headers["Age"] = str(age)
+    # Nothing newer can appear before the unit's next poll
+    headers["Cache-Control"] = (
+        "no-cache" if stale else f"max-age={max(0, DEFAULT_SCAN_INTERVAL - age)}"
+    )
+    return headers
+
+
+class DaikinSnapshotView(HomeAssistantView):
+    """Serve a unit's latest snapshot so other local tools never poll the unit.
+
+    GET /api/daikin_local/{unit}/{section} returns basic_info, control_info
+    or sensor_info in the unit's own k=v format, or as JSON with
+    ?format=json; section "snapshot" returns all three as JSON. The unit is
+    the config entry id or the unit's IP address.
+    """
+
+    url = "/api/daikin_local/{unit}/{section}"
+    name = "api:daikin_local:snapshot"
+
+    async def get(self, request: web.Request, unit: str, section: str) -> web.Response:
+        """Return the cached section of a unit's snapshot."""
+        hass: HomeAssistant = request.app[KEY_HASS]
+        if (coordinator := find_coordinator(hass, unit)) is None:
+            return self.json_message("Unknown unit", HTTPStatus.NOT_FOUND)
+        if section != "snapshot" and section not in SECTIONS:
+            return self.json_message("Unknown section", HTTPStatus.NOT_FOUND)
+        if coordinator.data is None:
+            return self.json_message(
+                "No snapshot yet", HTTPStatus.SERVICE_UNAVAILABLE
+            )
+
+        headers = _freshness_headers(coordinator)
+        if section == "snapshot":
+            data = {name: coordinator.data.get(name, {}) for name in SECTIONS}
+            return self.json(data, headers=headers)
+
+        data = coordinator.data.get(section, {})
+        if request.query.get("format") == "json":
+            return self.json(data, headers=headers)
+        body = ",".join(f"{key}={value}" for key, value in data.items())
+        return web.Response(text=body, content_type="text/plain", headers=headers)
+
+
+@callback
+def async_register_view(hass: HomeAssistant) -> None:
+    """Register the snapshot view once; it looks coordinators up per request."""
+    if hass.data.get(DATA_VIEW):
+        return
+    hass.http.register_view(DaikinSnapshotView())
+    hass.data[DATA_VIEW] = True
@@ -0,0 +1,70 @@
+"""Websocket API for live Daikin telemetry."""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_WEBSOCKET
+from .coordinator import find_coordinator
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "daikin_local/subscribe_telemetry",
+        vol.Required("unit"): str,
+    }
+)
+@callback
+def ws_subscribe_telemetry(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream a unit's control and sensor info changes to the connection.
+
+    The unit is its config entry id or IP address. The first event holds the
+    full control_info and sensor_info, later events only the changed fields.
+    When the unit's entry is unloaded a last event with "ended" set closes
+    the stream.
+    """
+    if (coordinator := find_coordinator(hass, msg["unit"])) is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Unknown unit")
+        return
+
+    @callback
+    def forward(diff: dict[str, Any]) -> None:
+        """Send one telemetry diff as a subscription event."""
+        connection.send_message(
+            websocket_api.event_message(
+                msg["id"], {"time": dt_util.utcnow().isoformat(), **diff}
+            )
+        )
+
+    @callback
+    def ended() -> None:
+        """Tell the subscriber the stream is over."""
+        connection.subscriptions.pop(msg["id"], None)
+        connection.send_message(
+            websocket_api.event_message(
+                msg["id"], {"time": dt_util.utcnow().isoformat(), "ended": True}
+            )
+        )
+
+    connection.send_result(msg["id"])
+    connection.subscriptions[msg["id"]] = coordinator.async_add_telemetry_listener(
+        forward, ended
+    )
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the websocket commands once."""
+    if hass.data.get(DATA_WEBSOCKET):
+        return
+    websocket_api.async_register_command(hass, ws_subscribe_telemetry)
+    hass.data[DATA_WEBSOCKET] = True
@@ -0,0 +1 @@
+"""Command line tools for Daikin AC units, built on the integration's DaikinClient."""
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Unified command line tool for Daikin AC units.
+
+Run from the scripts directory:
+
+    python3 -m daikin_tool probe --inventory units.json
+    python3 -m daikin_tool info --unit 192.168.2.239,UUID,KEY
+    python3 -m daikin_tool set --inventory units.json --mode cool --temperature 24
+    python3 -m daikin_tool bench --inventory units.json --rounds 5
+    python3 -m daikin_tool record --inventory units.json --output traffic.jsonl
+    python3 -m daikin_tool replay traffic.jsonl --speed 10
+
+Every subcommand runs against all units of the inventory concurrently;
+replay runs against the units of a recorded fixture instead.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote
+
+from .common import (
+    add_inventory_arguments,
+    create_client,
+    load_client_class,
+    load_component,
+    load_inventory,
+)
+
+
+def run_concurrently(inventory, func, concurrency):
+    """Run func(unit, client) for every unit and return results in inventory order."""
+    def task(unit):
+        client = create_client(unit)
+        try:
+            return func(unit, client)
+        except Exception as err:
+            return err
+        finally:
+            client.close()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(task, inventory))
+
+
+def cmd_probe(args, inventory):
+    """Check that every unit answers basic_info."""
+    def probe(unit, client):
+        start = time.monotonic()
+        ok = client.test_connection()
+        return ok, time.monotonic() - start, client.last_profile
+
+    results = run_concurrently(inventory, probe, args.concurrency)
+    failed = 0
+    for unit, result in zip(inventory, results):
+        if isinstance(result, Exception) or not result[0]:
+            failed += 1
+            print(f"❌ {unit['name']:<24} {unit['ip_address']:<16} unreachable")
+        else:
+            _, elapsed, profile = result
+            print(f"✅ {unit['name']:<24} {unit['ip_address']:<16} {elapsed * 1000:7.0f} ms  {profile}")
+    return failed == 0
+
+
+def cmd_info(args, inventory):
+    """Print basic, control and sensor info of every unit."""
+    results = run_concurrently(inventory, lambda unit, client: client.get_snapshot(), args.concurrency)
+    ok = True
+    for unit, result in zip(inventory, results):
+        print(f"\n{unit['name']} ({unit['ip_address']})")
+        if isinstance(result, Exception):
+            ok = False
+            print(f"   ❌ {result}")
+            continue
+        for section, data in result.items():
+            print(f"   {section}:")
+            for key, value in data.items():
+                print(f"      {key}: {unquote(value)}")
+    return ok
+
+
+def cmd_set(args, inventory):
+    """Apply the same control changes to every unit, one write per unit."""
+    load_component()
+    from daikin_local.const import HA_FAN_TO_DAIKIN, HA_MODE_TO_DAIKIN
+
+    changes = {}
+    if args.power is not None:
+        changes["pow"] = "1" if args.power == "on" else "0"
+    if args.mode is not None:
+        changes["mode"] = str(HA_MODE_TO_DAIKIN[args.mode])
+    if args.temperature is not None:
+        changes["stemp"] = str(args.temperature)
+    if args.fan is not None:
+        changes["f_rate"] = HA_FAN_TO_DAIKIN[args.fan]
+    if args.swing is not None:
+        changes["f_dir"] = "1" if args.swing == "on" else "0"
+    if not changes:
+        print("Nothing to set, use --power, --mode, --temperature, --fan or --swing")
+        return False
+
+    def apply(unit, client):
+        start = time.monotonic()
+        ok = client.update_control_info(**changes)
+        return ok, time.monotonic() - start
+
+    results = run_concurrently(inventory, apply, args.concurrency)
+    failed = 0
+    for unit, result in zip(inventory, results):
+        if isinstance(result, Exception) or not result[0]:
+            failed += 1
+            reason = result if isinstance(result, Exception) else "unit rejected the change"
+            print(f"❌ {unit['name']:<24} {reason}")
+        else:
+            print(f"✅ {unit['name']:<24} {result[1] * 1000:7.0f} ms")
+    return failed == 0
+
+
+def cmd_bench(args, inventory):
+    """Measure handshake and per-endpoint latency and report the winning TLS profile."""
+    load_component()
+    from daikin_local.const import (
+        ENDPOINT_BASIC_INFO,
+        ENDPOINT_CONTROL_INFO,
+        ENDPOINT_SENSOR_INFO,
+    )
+    endpoints = {
+        "basic": ENDPOINT_BASIC_INFO,
+        "control": ENDPOINT_CONTROL_INFO,
+        "sensor": ENDPOINT_SENSOR_INFO,
+    }
+
+    def bench(unit, client):
+        handshakes = []
+        latencies = {name: [] for name in endpoints}
+        profiles = set()
+        for _ in range(args.rounds):
+            for name, endpoint in endpoints.items():
+                start = time.monotonic()
+                client._make_request(endpoint)
+                latencies[name].append(time.monotonic() - start)
+                profiles.add(client.last_profile)
+                if "handshake" in client.last_timing:
+                    handshakes.append(client.last_timing["handshake"])
+        return handshakes, latencies, profiles
+
+    results = run_concurrently(inventory, bench, args.concurrency)
+    header = f"{'Unit':<24}{'Profile':<16}{'Handshake':>10}"
+    header += "".join(f"{name:>10}" for name in endpoints)
+    print(header)
+    print("-" * len(header))
+    ok = True
+    for unit, result in zip(inventory, results):
+        if isinstance(result, Exception):
+            ok = False
+            print(f"{unit['name']:<24}❌ {result}")
+            continue
+        handshakes, latencies, profiles = result
+        line = f"{unit['name']:<24}{','.join(sorted(profiles)):<16}"
+        line += f"{statistics.median(handshakes) * 1000:>8.0f}ms" if handshakes else f"{'-':>10}"
+        line += "".join(
+            f"{statistics.median(samples) * 1000:>8.0f}ms" for samples in latencies.values()
+        )
+        print(line)
+    print(f"\nMedians over {args.rounds} round(s) per unit")
+    return ok
+
+
+def cmd_record(args, inventory):
+    """Poll every unit and record the raw exchanges to a fixture file."""
+    load_component()
+    from daikin_local.traffic import TrafficRecorder
+
+    recorder = TrafficRecorder(args.output)
+
+    def record(unit, client):
+        recorder.attach(client, unit["name"])
+        errors = 0
+        for round_number in range(args.rounds):
+            if round_number:
+                time.sleep(args.interval)
+            try:
+                client.get_snapshot()
+            except Exception:
+                errors += 1
+        return errors
+
+    try:
+        results = run_concurrently(inventory, record, args.concurrency)
+    finally:
+        recorder.close()
+    for unit, result in zip(inventory, results):
+        if isinstance(result, Exception):
+            print(f"❌ {unit['name']:<24} {result}")
+        else:
+            print(f"✅ {unit['name']:<24} {args.rounds} round(s), {result} failed")
+    print(f"\nRecorded {recorder.recorded} exchange(s) to {args.output}")
+    return not any(isinstance(result, Exception) for result in results)
+
+
+def cmd_replay(args):
+    """Replay a fixture through DaikinClient, on the recorded schedule scaled by speed."""
+    DaikinClient = load_client_class()
+    from daikin_local.traffic import ReplayTransport, load_fixture
+
+    by_unit = {}
+    for exchange in load_fixture(args.fixture):
+        by_unit.setdefault(exchange["unit"], []).append(exchange)
+    if not by_unit:
+        print(f"No exchanges in {args.fixture}")
+        return False
+
+    def replay(unit, exchanges):
+        client = DaikinClient(ip_address=unit, uuid="", key="")
+        client.transport = ReplayTransport(exchanges, speed=args.speed)
+        errors = 0
+        latencies = []
+        start = time.monotonic()
+        for exchange in exchanges:
+            if args.speed:
+                delay = start + exchange["t"] / args.speed - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            params = {k: v for k, v in exchange["params"].items() if k != "key"}
+            request_start = time.monotonic()
+            try:
+                client._make_request(exchange["endpoint"], params)
+            except Exception:
+                errors += 1
+            latencies.append(time.monotonic() - request_start)
+        return len(exchanges), errors, latencies, time.monotonic() - start
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(lambda item: replay(*item), by_unit.items()))
+
+    print(f"{'Unit':<24}{'Requests':>9}{'Errors':>8}{'Median':>10}{'Elapsed':>10}")
+    for unit, (count, errors, latencies, elapsed) in zip(by_unit, results):
+        print(f"{unit:<24}{count:>9}{errors:>8}"
+              f"{statistics.median(latencies) * 1000:>8.2f}ms{elapsed:>9.2f}s")
+    print(f"\nReplayed {'without delays' if not args.speed else f'at {args.speed:g}x speed'}")
+    return True
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(prog="daikin_tool", description="Daikin AC command line tool")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    probe = subparsers.add_parser("probe", help="Check that units answer")
+    probe.set_defaults(func=cmd_probe)
+
+    info = subparsers.add_parser("info", help="Show basic, control and sensor info")
+    info.set_defaults(func=cmd_info)
+
+    set_parser = subparsers.add_parser("set", help="Change settings on all units")
+    set_parser.add_argument("--power", choices=["on", "off"])
+    set_parser.add_argument("--mode", choices=["auto", "cool", "heat", "dry", "fan_only"])
+    set_parser.add_argument("--temperature", type=float)
+    set_parser.add_argument("--fan", choices=["auto", "quiet", "low", "medium", "high", "max"])
+    set_parser.add_argument("--swing", choices=["on", "off"])
+    set_parser.set_defaults(func=cmd_set)
+
+    bench = subparsers.add_parser("bench", help="Measure handshake and endpoint latency")
+    bench.add_argument("--rounds", type=int, default=3, help="Requests per endpoint and unit (default: 3)")
+    bench.set_defaults(func=cmd_bench)
+
+    record = subparsers.add_parser("record", help="Record raw exchanges to a fixture file")
+    record.add_argument("--output", "-o", required=True, help="JSON-lines fixture to append to")
+    record.add_argument("--rounds", type=int, default=10, help="Polls per unit (default: 10)")
+    record.add_argument("--interval", type=float, default=1.0, help="Seconds between polls (default: 1)")
+    record.set_defaults(func=cmd_record)
+
+    replay = subparsers.add_parser("replay", help="Replay a fixture without the units")
+    replay.add_argument("fixture", help="JSON-lines fixture written by record")
+    replay.add_argument("--speed", type=float, default=1.0,
+                        help="Speed-up factor, 0 to replay without delays (default: 1)")
+    replay.set_defaults(func=cmd_replay)
+
+    for subparser in (probe, info, set_parser, bench, record, replay):
+        if subparser is not replay:
+            add_inventory_arguments(subparser)
+        subparser.add_argument("--concurrency", type=int, default=16, help="Units handled in parallel (default: 16)")
+
+    args = parser.parse_args()
+    if args.func is cmd_replay:
+        sys.exit(0 if cmd_replay(args) else 1)
+
+    inventory = load_inventory(args.inventory, args.unit)
+    if not inventory:
+        parser.error("no units given, use --inventory or --unit")
+
+    sys.exit(0 if args.func(args, inventory) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Helpers shared by the Daikin command line tools."""
+
+import importlib.util
+import json
+import os
+import sys
+
+COMPONENT_DIR = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'custom_components', 'daikin_local'
+)
+
+
+def load_component():
+    """Make the integration's modules importable without Home Assistant.
+
+    The package __init__ needs Home Assistant, but the client and const modules
+    do not, so the package is registered without running its __init__.
+    """
+    if "daikin_local" not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            "daikin_local",
+            os.path.join(COMPONENT_DIR, "__init__.py"),
+            submodule_search_locations=[COMPONENT_DIR],
+        )
+        sys.modules["daikin_local"] = importlib.util.module_from_spec(spec)
+
+
+def load_client_class():
+    """Import DaikinClient without importing Home Assistant."""
+    load_component()
+    from daikin_local.daikin_client import DaikinClient
+    return DaikinClient
+
+
+def load_inventory(path=None, units=None):
+    """Load units from a JSON inventory file and/or IP,UUID,KEY[,NAME] strings."""
+    inventory = []
+    if path:
+        with open(path) as f:
+            inventory.extend(json.load(f))
+    for unit in units or []:
+        parts = unit.split(',')
+        if len(parts) < 3:
+            raise ValueError(f"Expected IP,UUID,KEY[,NAME], got: {unit}")
+        inventory.append({
+            "ip_address": parts[0],
+            "uuid": parts[1],
+            "key": parts[2],
+            "name": parts[3] if len(parts) > 3 else parts[0],
+        })
+    for unit in inventory:
+        unit.setdefault("name", unit["ip_address"])
+    return inventory
+
+
+def create_client(unit):
+    """Create a DaikinClient for an inventory entry."""
+    DaikinClient = load_client_class()
+    return DaikinClient(
+        ip_address=unit["ip_address"],
+        uuid=unit.get("uuid", ""),
+        key=unit.get("key", ""),
+        port=unit.get("port"),
+        protocol=unit.get("protocol", "https"),
+    )
+
+
+def add_inventory_arguments(parser):
+    """Add the --inventory and --unit arguments to a parser."""
+    parser.add_argument("--inventory", "-i", help="JSON file with a list of {ip_address, uuid, key, name, port, protocol}")
+    parser.add_argument("--unit", "-u", action="append", help="Unit as IP,UUID,KEY[,NAME] (repeatable)")
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+High-rate telemetry sampler for Daikin AC units.
+Polls many units concurrently with DaikinClient and streams every sample to an
+append-only CSV or JSON-lines file, then reports the sustained rate per unit.
+"""
+
+import argparse
+import csv
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+from daikin_tool.common import add_inventory_arguments, create_client, load_inventory
+
+CSV_FIELDS = [
+    "time", "unit", "latency_ms", "htemp", "hhum", "otemp", "cmpfreq",
+    "pow", "mode", "stemp", "shum", "f_rate", "f_dir",
+]
+
+
+class UnitStats:
+    """Counters for one unit."""
+
+    def __init__(self):
+        self.samples = 0
+        self.errors = 0
+        self.dropped = 0
+        self.missed_ticks = 0
+        self.latency_total = 0.0
+
+
+class RowWriter(threading.Thread):
+    """Drain the sample queue into an append-only file with periodic flushes."""
+
+    def __init__(self, path, fmt, rows, flush_interval):
+        super().__init__(daemon=True)
+        self.path = path
+        self.fmt = fmt
+        self.rows = rows
+        self.flush_interval = flush_interval
+        self.written = 0
+
+    def run(self):
+        new_file = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        with open(self.path, 'a', newline='') as f:
+            writer = None
+            if self.fmt == "csv":
+                writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction='ignore')
+                if new_file:
+                    writer.writeheader()
+            last_flush = time.monotonic()
+            while True:
+                try:
+                    row = self.rows.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    row = None
+                if row is StopIteration:
+                    break
+                if row is not None:
+                    if writer:
+                        writer.writerow(row)
+                    else:
+                        f.write(json.dumps(row, separators=(',', ':')) + "\n")
+                    self.written += 1
+                if time.monotonic() - last_flush >= self.flush_interval:
+                    f.flush()
+                    os.fsync(f.fileno())
+                    last_flush = time.monotonic()
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def sample_unit(client, name, interval, deadline, rows, stats, stop):
+    """Sample one unit on a fixed schedule until the deadline or stop is set."""
+    next_tick = time.monotonic()
+    while not stop.is_set() and (deadline is None or next_tick < deadline):
+        start = time.monotonic()
+        try:
+            sensor_info = client.get_sensor_info()
+            control_info = client.get_control_info()
+        except Exception as err:
+            stats.errors += 1
+            print(f"⚠️  {name}: {err}", file=sys.stderr)
+        else:
+            latency = time.monotonic() - start
+            stats.samples += 1
+            stats.latency_total += latency
+            row = {
+                "time": datetime.now(timezone.utc).isoformat(timespec='milliseconds'),
+                "unit": name,
+                "latency_ms": round(latency * 1000),
+                **sensor_info,
+                **control_info,
+            }
+            row.pop("ret", None)
+            try:
+                rows.put_nowait(row)
+            except queue.Full:
+                stats.dropped += 1
+
+        # Keep the schedule fixed; skip ticks we were too slow to make
+        next_tick += interval
+        now = time.monotonic()
+        if now > next_tick:
+            missed = int((now - next_tick) // interval) + 1
+            stats.missed_ticks += missed
+            next_tick += missed * interval
+        stop.wait(max(0.0, next_tick - time.monotonic()))
+
+
+def run_sampler(inventory, output, fmt, interval, duration, flush_interval, queue_size):
+    """Sample all units concurrently and return per-unit stats and the elapsed time."""
+    rows = queue.Queue(maxsize=queue_size)
+    writer = RowWriter(output, fmt, rows, flush_interval)
+    writer.start()
+
+    stop = threading.Event()
+    deadline = time.monotonic() + duration if duration else None
+    clients = []
+    threads = []
+    stats = {}
+    for unit in inventory:
+        client = create_client(unit)
+        clients.append(client)
+        stats[unit["name"]] = UnitStats()
+        thread = threading.Thread(
+            target=sample_unit,
+            args=(client, unit["name"], interval, deadline, rows, stats[unit["name"]], stop),
+            daemon=True,
+        )
+        threads.append(thread)
+
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    try:
+        for thread in threads:
+            while thread.is_alive():
+                thread.join(0.5)
+    except KeyboardInterrupt:
+        print("\nStopping...")
+        stop.set()
+        for thread in threads:
+            thread.join()
+    elapsed = time.monotonic() - start
+
+    rows.put(StopIteration)
+    writer.join()
+    for client in clients:
+        client.close()
+    return stats, elapsed
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Sample Daikin AC telemetry to disk")
+    add_inventory_arguments(parser)
+    parser.add_argument("--output", "-o", required=True, help="Output file (.csv or .jsonl)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="Output format (default: from file extension)")
+    parser.add_argument("--interval", type=float, default=1.0, help="Seconds between samples per unit (default: 1)")
+    parser.add_argument("--duration", type=float, default=0, help="Seconds to run, 0 until interrupted (default: 0)")
+    parser.add_argument("--flush-interval", type=float, default=5.0, help="Seconds between flushes to disk (default: 5)")
+    parser.add_argument("--queue-size", type=int, default=10000, help="Max buffered rows before samples are dropped (default: 10000)")
+
+    args = parser.parse_args()
+
+    inventory = load_inventory(args.inventory, args.unit)
+    if not inventory:
+        parser.error("no units given, use --inventory or --unit")
+    fmt = args.format or ("csv" if args.output.endswith(".csv") else "jsonl")
+
+    print(f"Sampling {len(inventory)} unit(s) every {args.interval}s to {args.output} ({fmt})")
+    stats, elapsed = run_sampler(
+        inventory, args.output, fmt, args.interval, args.duration,
+        args.flush_interval, args.queue_size,
+    )
+
+    print("-" * 72)
+    print(f"{'Unit':<24}{'Samples':>9}{'Errors':>8}{'Dropped':>9}{'Missed':>8}{'Rate/s':>8}{'Avg ms':>8}")
+    for name, unit_stats in stats.items():
+        rate = unit_stats.samples / elapsed if elapsed else 0.0
+        avg = unit_stats.latency_total / unit_stats.samples * 1000 if unit_stats.samples else 0.0
+        print(f"{name:<24}{unit_stats.samples:>9}{unit_stats.errors:>8}{unit_stats.dropped:>9}"
+              f"{unit_stats.missed_ticks:>8}{rate:>8.2f}{avg:>8.0f}")
+    print(f"Elapsed: {elapsed:.1f}s")
+
+    sys.exit(0 if all(s.samples for s in stats.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
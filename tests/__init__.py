@@ -0,0 +1 @@
+"""Tests for the Daikin Local integration."""
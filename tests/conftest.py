@@ -0,0 +1,116 @@
+"""Fixtures for Daikin Local tests."""
+from __future__ import annotations
+
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import CONF_NAME
+
+from custom_components.daikin_local.const import (
+    CONF_IP_ADDRESS,
+    CONF_KEY,
+    CONF_PROTOCOL,
+    CONF_UUID,
+    DOMAIN,
+    ENDPOINT_BASIC_INFO,
+    ENDPOINT_CONTROL_INFO,
+    ENDPOINT_SENSOR_INFO,
+    ENDPOINT_SET_CONTROL,
+    PROTOCOL_HTTPS,
+)
+from custom_components.daikin_local.daikin_client import DaikinClient
+from custom_components.daikin_local.traffic import ReplayTransport
+
+FAKE_EXCHANGES = [
+    {"t": 0.0, "endpoint": ENDPOINT_BASIC_INFO, "params": {},
+     "body": "ret=OK,type=aircon,name=%54%65%73%74,mac=AABBCCDDEEFF,ver=1_16,err=0"},
+    {"t": 0.0, "endpoint": ENDPOINT_CONTROL_INFO, "params": {},
+     "body": "ret=OK,pow=1,mode=3,stemp=24.0,shum=0,f_rate=A,f_dir=0"},
+    {"t": 0.0, "endpoint": ENDPOINT_SENSOR_INFO, "params": {},
+     "body": "ret=OK,htemp=25.5,hhum=50,otemp=31.0,err=0,cmpfreq=30"},
+    {"t": 0.0, "endpoint": ENDPOINT_SET_CONTROL, "params": {}, "body": "ret=OK"},
+]
+
+UNIT_DATA = {
+    CONF_IP_ADDRESS: "192.0.2.1",
+    CONF_UUID: "test",
+    CONF_KEY: "test",
+    CONF_NAME: "Test",
+}
+
+
+class FakeDaikinClient(DaikinClient):
+    """Client answering from canned exchanges instead of the unit.
+
+    Only the transport is replaced, so requests are counted per endpoint
+    exactly as the real client counts them.
+    """
+
+    instances: list[FakeDaikinClient] = []
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the client and remember it."""
+        super().__init__(*args, **kwargs)
+        self.transport = ReplayTransport(FAKE_EXCHANGES, speed=0, loop=True)
+        self.closed = False
+        self.instances.append(self)
+
+    def close(self) -> None:
+        """Close the client and record that it was closed."""
+        super().close()
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Load the integration from custom_components."""
+
+
+@contextmanager
+def patch_client(client_class: type[FakeDaikinClient]) -> Iterator[None]:
+    """Replace DaikinClient everywhere the integration creates one."""
+    client_class.instances = []
+    with patch(
+        "custom_components.daikin_local.DaikinClient", client_class
+    ), patch(
+        "custom_components.daikin_local.config_flow.DaikinClient", client_class
+    ), patch(
+        "custom_components.daikin_local.config_flow.async_discover_units",
+        return_value=[],
+    ):
+        yield
+
+
+@pytest.fixture
+def fake_client() -> Generator[type[FakeDaikinClient], None, None]:
+    """Answer every client the integration creates from canned exchanges."""
+    with patch_client(FakeDaikinClient):
+        yield FakeDaikinClient
+
+
+@pytest.fixture
+def config_entry(hass) -> MockConfigEntry:
+    """Add a config entry for one HTTPS unit."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=UNIT_DATA[CONF_NAME],
+        data={**UNIT_DATA, CONF_PROTOCOL: PROTOCOL_HTTPS},
+        unique_id="AABBCCDDEEFF",
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+async def init_integration(
+    hass, fake_client: type[FakeDaikinClient], config_entry: MockConfigEntry
+) -> MockConfigEntry:
+    """Set up the integration with one unit."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    return config_entry
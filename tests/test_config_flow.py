@@ -0,0 +1,114 @@
+"""Tests for the bulk import step of the config flow."""
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.daikin_local.config_flow import BULK_IMPORT, CONF_UNITS
+from custom_components.daikin_local.const import CONF_IP_ADDRESS, DOMAIN
+
+from .conftest import FakeDaikinClient
+
+
+async def _submit_bulk(hass: HomeAssistant, text: str) -> dict[str, Any]:
+    """Open the bulk import step and submit the pasted text."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    assert result["step_id"] == "pick_device"
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_IP_ADDRESS: BULK_IMPORT}
+    )
+    assert result["step_id"] == "bulk"
+    return await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_UNITS: text}
+    )
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "ip_address: 192.0.2.10\nkey: secret",
+        '"192.0.2.10,uuid,key,Living room"',
+        "|\n  192.0.2.10",
+    ],
+    ids=["mapping", "quoted_scalar", "block_scalar"],
+)
+async def test_bulk_rejects_yaml_that_is_not_a_list(
+    hass: HomeAssistant, fake_client: type[FakeDaikinClient], text: str
+) -> None:
+    """YAML mappings and quoted or block scalars are a form error, not lines."""
+    result = await _submit_bulk(hass, text)
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "invalid_units"}
+    assert not fake_client.instances
+
+
+async def test_bulk_rejects_nested_values(
+    hass: HomeAssistant, fake_client: type[FakeDaikinClient]
+) -> None:
+    """Nested values are reported instead of stringified."""
+    text = "- ip_address: 192.0.2.10\n  name: [Living, room]\n- ip_address: {a: b}"
+    result = await _submit_bulk(hass, text)
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "no_units"}
+    failures = result["description_placeholders"]["failures"].splitlines()
+    assert len(failures) == 2
+    assert all("plain strings" in failure for failure in failures)
+    assert not fake_client.instances
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["192.0.2.300", "living-room,uuid,key,Living room", "- ip_address: not an ip"],
+    ids=["out_of_range", "hostname", "yaml"],
+)
+async def test_bulk_rejects_invalid_ip_address(
+    hass: HomeAssistant, fake_client: type[FakeDaikinClient], text: str
+) -> None:
+    """Entries whose address is not an IP address are reported and not tried."""
+    result = await _submit_bulk(hass, text)
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "no_units"}
+    assert "invalid IP address" in result["description_placeholders"]["failures"]
+    assert not fake_client.instances
+
+
+async def test_bulk_rejects_malformed_lines(
+    hass: HomeAssistant, fake_client: type[FakeDaikinClient]
+) -> None:
+    """Lines with the wrong number of fields are reported, valid ones still tried."""
+    result = await _submit_bulk(hass, "192.0.2.10,uuid\n192.0.2.11,,,Bedroom")
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "bulk_failed"}
+    assert "192.0.2.10,uuid: expected ip_address" in (
+        result["description_placeholders"]["failures"]
+    )
+    await hass.async_block_till_done()
+    assert [entry.title for entry in hass.config_entries.async_entries(DOMAIN)] == [
+        "Bedroom"
+    ]
+
+
+async def test_bulk_names_units_after_their_address(
+    hass: HomeAssistant, fake_client: type[FakeDaikinClient]
+) -> None:
+    """Units imported without a name are named after their IP address."""
+    result = await _submit_bulk(hass, "192.0.2.10\n192.0.2.11,,,")
+
+    assert result["type"] == FlowResultType.ABORT
+    assert result["reason"] == "bulk_imported"
+    await hass.async_block_till_done()
+    assert sorted(entry.title for entry in hass.config_entries.async_entries(DOMAIN)) == [
+        "192.0.2.10",
+        "192.0.2.11",
+    ]
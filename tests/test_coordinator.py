@@ -0,0 +1,104 @@
+"""Tests for the per-unit coordinator."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Generator
+import threading
+import time
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.daikin_local.const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from custom_components.daikin_local.coordinator import DaikinCoordinator
+
+from .conftest import FakeDaikinClient, patch_client
+
+
+class SlowDaikinClient(FakeDaikinClient):
+    """Fake client whose requests take a while and record how many overlap."""
+
+    instances: list[FakeDaikinClient] = []
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the client and wrap its transport."""
+        super().__init__(*args, **kwargs)
+        self._replay = self.transport
+        self.transport = self._slow
+
+    def _slow(self, endpoint: str, params: dict[str, Any], deadline: float) -> str:
+        """Answer after a short delay, counting requests in flight."""
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        try:
+            time.sleep(0.02)
+            return self._replay(endpoint, params, deadline)
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+
+@pytest.fixture
+def slow_client() -> Generator[type[SlowDaikinClient], None, None]:
+    """Answer every client the integration creates slowly."""
+    SlowDaikinClient.active = SlowDaikinClient.max_active = 0
+    with patch_client(SlowDaikinClient):
+        yield SlowDaikinClient
+
+
+async def test_unit_requests_never_overlap(
+    hass: HomeAssistant,
+    slow_client: type[SlowDaikinClient],
+    config_entry: MockConfigEntry,
+) -> None:
+    """Polls, telemetry samples and writes take turns on the unit."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator: DaikinCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    slow_client.max_active = 0
+
+    remove = coordinator.async_add_telemetry_listener(lambda diff: None, lambda: None)
+    await asyncio.gather(
+        coordinator.async_refresh(),
+        coordinator.async_update_control(stemp="22.0"),
+        coordinator.async_update_control(f_rate="3"),
+        coordinator.async_refresh(),
+    )
+    remove()
+
+    assert slow_client.max_active == 1
+
+
+async def test_command_keeps_next_poll_on_slot(
+    hass: HomeAssistant,
+    fake_client: type[FakeDaikinClient],
+    config_entry: MockConfigEntry,
+) -> None:
+    """A command does not move the next scheduled poll off the unit's slot."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator: DaikinCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    # Move the slot, so a poll scheduled from the time of the write misses it
+    coordinator._poll_slot += 10
+
+    await hass.services.async_call(
+        "climate",
+        "set_temperature",
+        {"entity_id": "climate.test", "temperature": 22},
+        blocking=True,
+    )
+
+    next_poll = coordinator._unsub_refresh.__self__.when()
+    now = hass.loop.time()
+    assert -1 <= next_poll - now <= DEFAULT_SCAN_INTERVAL + 1
+    # The base class truncates the loop time to the second when scheduling
+    offset = (next_poll - coordinator._poll_slot) % DEFAULT_SCAN_INTERVAL
+    assert min(offset, DEFAULT_SCAN_INTERVAL - offset) <= 1
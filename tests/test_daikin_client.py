@@ -0,0 +1,90 @@
+"""Tests for skipping control writes that would change nothing."""
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+from custom_components.daikin_local.const import (
+    CONF_IP_ADDRESS,
+    CONF_KEY,
+    CONF_UUID,
+    ENDPOINT_CONTROL_INFO,
+    ENDPOINT_SET_CONTROL,
+)
+
+from .conftest import FAKE_EXCHANGES, UNIT_DATA, FakeDaikinClient
+
+
+class FakeUnit:
+    """Unit whose settings can also be changed with its IR remote."""
+
+    def __init__(self) -> None:
+        """Start from the canned control info."""
+        self.control = {"pow": "1", "mode": "3", "stemp": "24.0", "shum": "0",
+                        "f_rate": "A", "f_dir": "0"}
+        self.writes: list[dict[str, Any]] = []
+
+    def __call__(self, endpoint: str, params: dict[str, Any], deadline: float) -> str:
+        """Answer a request like the unit."""
+        if endpoint == ENDPOINT_SET_CONTROL:
+            self.writes.append(dict(params))
+            self.control.update(params)
+            return "ret=OK"
+        if endpoint == ENDPOINT_CONTROL_INFO:
+            return "ret=OK," + ",".join(f"{key}={value}" for key, value in self.control.items())
+        return next(
+            exchange["body"] for exchange in FAKE_EXCHANGES if exchange["endpoint"] == endpoint
+        )
+
+
+def _client() -> tuple[FakeDaikinClient, FakeUnit]:
+    """Return a client talking to a fake unit."""
+    client = FakeDaikinClient(
+        ip_address=UNIT_DATA[CONF_IP_ADDRESS],
+        uuid=UNIT_DATA[CONF_UUID],
+        key=UNIT_DATA[CONF_KEY],
+    )
+    client.transport = unit = FakeUnit()
+    return client, unit
+
+
+def test_repeated_write_is_skipped() -> None:
+    """A write matching the control info just written is not sent."""
+    client, unit = _client()
+    assert client.update_control_info(stemp="22.0")
+    assert client.update_control_info(stemp="22.0")
+    assert len(unit.writes) == 1
+    assert client.suppressed_writes == 1
+    client.close()
+
+
+def test_stale_control_info_is_not_trusted() -> None:
+    """A write 10 seconds after a poll is sent, the remote may have changed the unit."""
+    client, unit = _client()
+    client.get_snapshot()
+    unit.control["stemp"] = "26.0"  # changed with the IR remote after the poll
+
+    with patch(
+        "custom_components.daikin_local.daikin_client.time.monotonic",
+        return_value=client._control_info_time + 10,
+    ):
+        assert client.update_control_info(stemp="24.0")
+
+    assert unit.control["stemp"] == "24.0"
+    assert client.suppressed_writes == 0
+    client.close()
+
+
+def test_poll_that_disagrees_invalidates_control_info() -> None:
+    """After a poll finds the unit changed elsewhere, writes are not skipped."""
+    client, unit = _client()
+    client.get_snapshot()
+    unit.control["stemp"] = "26.0"
+    client.get_snapshot()  # sees the IR remote's change
+    unit.control["stemp"] = "24.0"  # and the remote changes it back
+
+    assert client.update_control_info(stemp="26.0")
+
+    assert unit.control["stemp"] == "26.0"
+    assert client.suppressed_writes == 0
+    client.close()
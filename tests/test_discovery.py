@@ -0,0 +1,101 @@
+"""Tests for network discovery in the config flow."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator
+from functools import partial
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.daikin_local.const import (
+    CONF_IP_ADDRESS,
+    DISCOVERY_MESSAGE,
+    DOMAIN,
+    PROTOCOL_HTTP,
+    PROTOCOL_HTTPS,
+)
+from custom_components.daikin_local.daikin_client import SSL_CONFIG
+from custom_components.daikin_local.discovery import async_discover_units, async_sweep
+
+from .conftest import FakeDaikinClient
+
+BASIC_INFO = b"ret=OK,type=aircon,name=%4c%69%76%69%6e%67,mac=AABBCCDDEEFF,ver=1_16"
+
+
+class _Responder(asyncio.DatagramProtocol):
+    """Answer the discovery probe like a unit."""
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Keep the transport to reply on."""
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Reply to the probe with basic_info."""
+        if data == DISCOVERY_MESSAGE:
+            self.transport.sendto(BASIC_INFO, addr)
+
+
+@pytest.fixture
+async def responder_port(socket_enabled: None) -> AsyncGenerator[int, None]:
+    """Run a unit answering the UDP probe on localhost."""
+    transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+        _Responder, local_addr=("127.0.0.1", 0)
+    )
+    yield transport.get_extra_info("sockname")[1]
+    transport.close()
+
+
+async def test_pick_device_lists_unit_answering_udp_probe(
+    hass: HomeAssistant, fake_client: type[FakeDaikinClient], responder_port: int
+) -> None:
+    """A unit answering the UDP probe is offered in the pick list."""
+    discover = partial(
+        async_discover_units, broadcast_address="127.0.0.1", udp_port=responder_port
+    )
+    with patch(
+        "custom_components.daikin_local.config_flow.async_discover_units", discover
+    ):
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "pick_device"
+    choices = result["data_schema"].schema[CONF_IP_ADDRESS].container
+    assert choices["127.0.0.1"] == "Living (127.0.0.1, AABBCCDDEEFF, fw 1.16)"
+
+
+async def test_sweep_tries_http_before_https(hass: HomeAssistant) -> None:
+    """The sweep fingerprints HTTP first and falls back to HTTPS."""
+    answers = {
+        ("192.0.2.10", PROTOCOL_HTTP): {"ret": "OK", "name": "http"},
+        ("192.0.2.11", PROTOCOL_HTTPS): {"ret": "OK", "name": "https"},
+    }
+    calls: list[tuple[str, str]] = []
+
+    async def fingerprint(host: str, protocol: str) -> dict[str, str] | None:
+        calls.append((host, protocol))
+        return answers.get((host, protocol))
+
+    with patch(
+        "custom_components.daikin_local.discovery._async_port_open", return_value=True
+    ):
+        found = await async_sweep(
+            hass, ["192.0.2.10", "192.0.2.11"], fingerprint=fingerprint
+        )
+
+    assert found == {
+        "192.0.2.10": {"ret": "OK", "name": "http"},
+        "192.0.2.11": {"ret": "OK", "name": "https"},
+    }
+    assert sorted(calls) == [
+        ("192.0.2.10", PROTOCOL_HTTP),
+        ("192.0.2.11", PROTOCOL_HTTP),
+        ("192.0.2.11", PROTOCOL_HTTPS),
+    ]
+    assert SSL_CONFIG.refs == 0
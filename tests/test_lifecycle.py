@@ -0,0 +1,219 @@
+"""Lifecycle soak tests: setup, unload and config flow must not leak.
+
+Each cycle runs the real async_setup_entry, async_unload_entry and
+validate_input, including their failure paths, and the tests fail if file
+descriptors, OpenSSL temp config files, threads, shared config references
+or memory allocated by the integration keep growing, or if any client is left open.
+
+The default run is short; the long soak runs thousands of cycles and only
+runs when selected with ``pytest -m slow``.
+"""
+from __future__ import annotations
+
+from collections.abc import Generator
+import gc
+import glob
+import logging
+import os
+import tempfile
+import threading
+import tracemalloc
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from custom_components.daikin_local.config_flow import CannotConnect, validate_input
+from custom_components.daikin_local.const import (
+    CONF_IP_ADDRESS,
+    CONF_KEY,
+    CONF_PROTOCOL,
+    CONF_UUID,
+    DATA_EXECUTOR,
+    DOMAIN,
+    PROTOCOL_HTTPS,
+)
+from custom_components.daikin_local.daikin_client import SSL_CONFIG
+
+from .conftest import UNIT_DATA, FakeDaikinClient, patch_client
+
+UNREACHABLE_IP = "192.0.2.2"
+WARMUP = 20
+CYCLES = 100
+# Cycles of the long soak; override with DAIKIN_SOAK_CYCLES
+SOAK_CYCLES = int(os.environ.get("DAIKIN_SOAK_CYCLES", "3000"))
+# Memory the integration may keep allocated after warmup, in KiB
+MAX_MEMORY_GROWTH = 64
+
+
+class SoakDaikinClient(FakeDaikinClient):
+    """Fake client that takes the shared OpenSSL config like the curl fallback."""
+
+    instances: list[FakeDaikinClient] = []
+    reachable = True
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the client and take a config reference."""
+        super().__init__(*args, **kwargs)
+        self._get_ssl_config()
+        if not self.reachable or self.ip_address == UNREACHABLE_IP:
+            self.transport = self._unreachable
+
+    def _unreachable(self, endpoint: str, params: dict[str, Any], deadline: float) -> str:
+        """Fail every request like a unit that does not answer."""
+        raise OSError("unit unreachable")
+
+
+@pytest.fixture
+def soak_client() -> Generator[type[SoakDaikinClient], None, None]:
+    """Answer every client the integration creates, holding a config reference."""
+    SoakDaikinClient.reachable = True
+    with patch_client(SoakDaikinClient):
+        yield SoakDaikinClient
+
+
+@pytest.fixture
+def unreachable_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Add an entry whose unit never answers, so it never stores a snapshot."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Unreachable",
+        data={
+            **UNIT_DATA,
+            CONF_IP_ADDRESS: UNREACHABLE_IP,
+            CONF_NAME: "Unreachable",
+            CONF_PROTOCOL: PROTOCOL_HTTPS,
+        },
+        unique_id="112233445566",
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+def _measure() -> tuple[int, int, int, int]:
+    """Return open descriptors, OpenSSL temp configs, integration threads and traced bytes."""
+    gc.collect()
+    fds = len(os.listdir(f"/proc/{os.getpid()}/fd"))
+    temp_configs = len(glob.glob(os.path.join(tempfile.gettempdir(), "tmp*.conf")))
+    # Home Assistant's own executor grows on demand, so only count ours
+    threads = sum(thread.name.startswith(DOMAIN) for thread in threading.enumerate())
+    # Only count memory allocated by the integration, Home Assistant keeps
+    # every entity platform it ever set up
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(True, os.path.join("*", "custom_components", DOMAIN, "*"))]
+    )
+    memory = sum(stat.size for stat in snapshot.statistics("filename"))
+    return fds, temp_configs, threads, memory
+
+
+async def _setup_unload_cycle(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+    """Set an entry up, send a command and unload it again."""
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    await hass.services.async_call(
+        "climate",
+        "set_temperature",
+        {"entity_id": "climate.test", "temperature": 22},
+        blocking=True,
+    )
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def _failed_setup_cycle(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+    """Fail setup on an unreachable unit, leaving the entry to be retried."""
+    # Setting up the integration's first entry also tries every other one
+    if entry.state is not ConfigEntryState.NOT_LOADED:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def _config_flow_cycle(
+    hass: HomeAssistant, soak_client: type[SoakDaikinClient]
+) -> None:
+    """Validate a keyed unit, an unkeyed one and an unreachable one."""
+    await validate_input(hass, UNIT_DATA)
+    await validate_input(hass, {**UNIT_DATA, CONF_UUID: "", CONF_KEY: ""})
+    soak_client.reachable = False
+    try:
+        with pytest.raises(CannotConnect):
+            await validate_input(hass, UNIT_DATA)
+    finally:
+        soak_client.reachable = True
+
+
+async def _soak(
+    hass: HomeAssistant,
+    soak_client: type[SoakDaikinClient],
+    entry: MockConfigEntry,
+    unreachable_entry: MockConfigEntry,
+    cycles: int,
+) -> None:
+    """Run warmup and soak cycles and check that nothing kept growing."""
+
+    async def run(count: int) -> None:
+        for _ in range(count):
+            await _setup_unload_cycle(hass, entry)
+            await _failed_setup_cycle(hass, unreachable_entry)
+            await _config_flow_cycle(hass, soak_client)
+            assert all(client.closed for client in soak_client.instances)
+            soak_client.instances.clear()
+            # The harness's storage mocks record every call with its arguments
+            Store._async_load.reset_mock()
+            Store._async_write_data.reset_mock()
+
+    tracemalloc.start()
+    try:
+        await run(WARMUP)
+        baseline = _measure()
+        await run(cycles)
+        fds, temp_configs, threads, memory = _measure()
+    finally:
+        tracemalloc.stop()
+
+    assert fds <= baseline[0], f"file descriptors grew by {fds - baseline[0]}"
+    assert temp_configs <= baseline[1], f"temp config files grew by {temp_configs - baseline[1]}"
+    assert threads <= baseline[2], f"threads grew by {threads - baseline[2]}"
+    growth = (memory - baseline[3]) / 1024
+    assert growth <= MAX_MEMORY_GROWTH, f"traced memory grew by {growth:.0f} KiB"
+    assert SSL_CONFIG.refs == 0
+    assert DOMAIN not in hass.data or not hass.data[DOMAIN]
+    assert DATA_EXECUTOR not in hass.data
+
+
+@pytest.fixture
+def quiet_logs(caplog: pytest.LogCaptureFixture) -> None:
+    """Keep the expected failure logs of every cycle out of the captured records."""
+    caplog.set_level(logging.CRITICAL)
+
+
+async def test_lifecycle_soak(
+    hass: HomeAssistant,
+    soak_client: type[SoakDaikinClient],
+    config_entry: MockConfigEntry,
+    unreachable_entry: MockConfigEntry,
+    quiet_logs: None,
+) -> None:
+    """Repeated setup, unload and config flow cycles release everything."""
+    await _soak(hass, soak_client, config_entry, unreachable_entry, CYCLES)
+
+
+@pytest.mark.slow
+async def test_lifecycle_long_soak(
+    hass: HomeAssistant,
+    soak_client: type[SoakDaikinClient],
+    config_entry: MockConfigEntry,
+    unreachable_entry: MockConfigEntry,
+    quiet_logs: None,
+) -> None:
+    """Thousands of lifecycle cycles release everything."""
+    await _soak(hass, soak_client, config_entry, unreachable_entry, SOAK_CYCLES)
@@ -0,0 +1,92 @@
+"""Measure the climate attributes the recorder stores on every state change.
+
+The recorder writes a new state_attributes row whenever any recorded
+attribute changes, which for a unit whose room temperature moves is every
+poll. These tests serialize the attributes exactly as the recorder does and
+fail if the row grows past its budget, or if the trimmed payload stops
+saving against the attributes the climate entity used to record.
+"""
+from __future__ import annotations
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers.json import json_bytes
+
+from custom_components.daikin_local.const import (
+    ATTR_CURRENT_HUMIDITY,
+    ATTR_DEVICE_NAME,
+    ATTR_ERROR_STATUS,
+    ATTR_FAN_DIRECTION,
+    ATTR_FAN_SPEED,
+    ATTR_FIRMWARE_VERSION,
+    ATTR_MODE,
+    ATTR_POWER,
+    DEFAULT_SCAN_INTERVAL,
+)
+
+# Bytes of one recorded climate state_attributes row
+RECORDED_ATTRIBUTES_BUDGET = 128
+# Worst case: the room temperature changes on every poll
+ROWS_PER_DAY = 86400 // DEFAULT_SCAN_INTERVAL
+# Bytes per unit-day the trimmed attributes must save at least
+MIN_SAVING_PER_UNIT_DAY = 350_000
+
+# Attributes the recorder leaves out of every domain
+RECORDER_EXCLUDED = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
+
+
+def _recorded(state: State) -> bytes:
+    """Serialize the attributes the recorder would store for a state."""
+    excluded = RECORDER_EXCLUDED | state.state_info["unrecorded_attributes"]
+    return json_bytes({k: v for k, v in state.attributes.items() if k not in excluded})
+
+
+async def test_climate_recorded_attributes(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """The climate row stays within budget and carries no duplicated fields."""
+    state = hass.states.get("climate.test")
+    recorded = _recorded(state)
+
+    assert len(recorded) <= RECORDED_ATTRIBUTES_BUDGET, recorded
+    for attribute in (
+        ATTR_POWER,
+        ATTR_MODE,
+        ATTR_FAN_SPEED,
+        ATTR_FAN_DIRECTION,
+        ATTR_ERROR_STATUS,
+        ATTR_DEVICE_NAME,
+        ATTR_FIRMWARE_VERSION,
+    ):
+        assert f'"{attribute}"'.encode() not in recorded
+
+
+async def test_climate_recorder_saving_per_unit_day(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """The trimmed row saves against the attributes the entity used to record."""
+    state = hass.states.get("climate.test")
+    # The entity used to add these, and recorded fan direction and error status
+    removed = {
+        ATTR_POWER: state.state != "off",
+        ATTR_MODE: state.state,
+        ATTR_FAN_SPEED: state.attributes["fan_mode"],
+        ATTR_CURRENT_HUMIDITY: state.attributes[ATTR_CURRENT_HUMIDITY],
+        ATTR_DEVICE_NAME: "Test",
+        ATTR_FIRMWARE_VERSION: "1_16",
+    }
+    excluded = (RECORDER_EXCLUDED | state.state_info["unrecorded_attributes"]) - {
+        ATTR_FAN_DIRECTION,
+        ATTR_ERROR_STATUS,
+    }
+    before = json_bytes(
+        {k: v for k, v in {**state.attributes, **removed}.items() if k not in excluded}
+    )
+    after = _recorded(state)
+
+    saving = (len(before) - len(after)) * ROWS_PER_DAY
+    assert saving >= MIN_SAVING_PER_UNIT_DAY, (
+        f"{len(before)} -> {len(after)} bytes per row, {saving} bytes per unit-day"
+    )
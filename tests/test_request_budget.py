@@ -0,0 +1,185 @@
+"""Request budgets of the integration's actions.
+
+The units serve one connection at a time, so every extra round trip delays
+the next poll. Each test runs a real integration action against the fake
+client and checks the requests it sent per endpoint; change a budget only
+on purpose.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.util import dt as dt_util
+
+from custom_components.daikin_local.config_flow import MANUAL_ENTRY
+from custom_components.daikin_local.const import (
+    CONF_IP_ADDRESS,
+    DOMAIN,
+    ENDPOINT_BASIC_INFO,
+    ENDPOINT_CONTROL_INFO,
+    ENDPOINT_SENSOR_INFO,
+    ENDPOINT_SET_CONTROL,
+    SERVICE_SET_GROUP,
+)
+from custom_components.daikin_local.coordinator import DaikinCoordinator
+
+from .conftest import UNIT_DATA, FakeDaikinClient
+
+POLL = {ENDPOINT_BASIC_INFO: 1, ENDPOINT_CONTROL_INFO: 1, ENDPOINT_SENSOR_INFO: 1}
+WRITE = {ENDPOINT_CONTROL_INFO: 1, ENDPOINT_SET_CONTROL: 1}
+
+CLIMATE = "climate.test"
+POWER = "switch.test_power"
+SWING = "switch.test_fan_direction"
+
+# Entity commands whose values differ from the canned control info
+COMMANDS = {
+    "climate set_temperature": ("climate", "set_temperature", {"entity_id": CLIMATE, "temperature": 22}),
+    "climate set_hvac_mode off": ("climate", "set_hvac_mode", {"entity_id": CLIMATE, "hvac_mode": "off"}),
+    "climate set_hvac_mode heat": ("climate", "set_hvac_mode", {"entity_id": CLIMATE, "hvac_mode": "heat"}),
+    "climate set_fan_mode": ("climate", "set_fan_mode", {"entity_id": CLIMATE, "fan_mode": "low"}),
+    "switch power off": ("switch", "turn_off", {"entity_id": POWER}),
+    "switch swing on": ("switch", "turn_on", {"entity_id": SWING}),
+    "set_group": (
+        DOMAIN,
+        SERVICE_SET_GROUP,
+        {
+            "entity_id": [CLIMATE],
+            "hvac_mode": "heat",
+            "temperature": 22,
+            "fan_mode": "low",
+            "swing": True,
+        },
+    ),
+}
+
+
+def _coordinator(hass: HomeAssistant, entry: MockConfigEntry) -> DaikinCoordinator:
+    """Return the coordinator of a loaded entry."""
+    return hass.data[DOMAIN][entry.entry_id]
+
+
+def _requests(hass: HomeAssistant, entry: MockConfigEntry) -> Counter:
+    """Return the requests the entry's client sent since they were last cleared."""
+    return +_coordinator(hass, entry).client.requests
+
+
+async def test_config_flow(hass: HomeAssistant, fake_client: type[FakeDaikinClient]) -> None:
+    """Validating a unit reads its basic info once."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_IP_ADDRESS: MANUAL_ENTRY}
+    )
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], UNIT_DATA)
+    await hass.async_block_till_done()
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    validation = fake_client.instances[0]
+    assert +validation.requests == Counter({ENDPOINT_BASIC_INFO: 1})
+    assert validation.closed
+
+
+async def test_startup(
+    hass: HomeAssistant, fake_client: type[FakeDaikinClient], config_entry: MockConfigEntry
+) -> None:
+    """Setup without a stored snapshot polls once, and the next poll waits for the slot."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert _requests(hass, config_entry) == Counter(POLL)
+
+    # Nothing else is sent until the unit's slot comes. The base class rounds
+    # the scheduled time down to the second and the harness fires up to half a
+    # second late, so stop two seconds short of the slot
+    coordinator = _coordinator(hass, config_entry)
+    start = dt_util.utcnow()
+    for second in range(1, int(coordinator.update_interval.total_seconds()) - 1):
+        async_fire_time_changed(hass, start + timedelta(seconds=second))
+        await hass.async_block_till_done()
+    assert _requests(hass, config_entry) == Counter(POLL)
+
+
+async def test_scheduled_refresh(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """A scheduled refresh polls basic, control and sensor info once each."""
+    coordinator = _coordinator(hass, init_integration)
+    coordinator.client.requests.clear()
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + coordinator.update_interval + timedelta(seconds=1)
+    )
+    await hass.async_block_till_done()
+    assert _requests(hass, init_integration) == Counter(POLL)
+
+
+async def test_telemetry_sample(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """A telemetry sample reads control and sensor info, not basic info."""
+    coordinator = _coordinator(hass, init_integration)
+    coordinator.client.requests.clear()
+
+    events: list[dict[str, Any]] = []
+    remove = coordinator.async_add_telemetry_listener(events.append, lambda: None)
+    try:
+        async with asyncio.timeout(5):
+            while sum(coordinator.client.requests.values()) < 2:
+                await asyncio.sleep(0.01)
+    finally:
+        remove()
+    assert _requests(hass, init_integration) == Counter(
+        {ENDPOINT_CONTROL_INFO: 1, ENDPOINT_SENSOR_INFO: 1}
+    )
+
+
+@pytest.mark.parametrize("command", COMMANDS.values(), ids=COMMANDS.keys())
+async def test_command(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    command: tuple[str, str, dict[str, Any]],
+) -> None:
+    """Every entity command reads the control info once and writes it once."""
+    domain, service, data = command
+    _coordinator(hass, init_integration).client.requests.clear()
+
+    await hass.services.async_call(domain, service, data, blocking=True)
+    assert _requests(hass, init_integration) == Counter(WRITE)
+
+
+async def test_repeated_command(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """A command repeating the unit's current settings is not sent."""
+    domain, service, data = COMMANDS["climate set_temperature"]
+    await hass.services.async_call(domain, service, data, blocking=True)
+    _coordinator(hass, init_integration).client.requests.clear()
+
+    await hass.services.async_call(domain, service, data, blocking=True)
+    assert _requests(hass, init_integration) == Counter()
+
+
+async def test_forced_repeated_command(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    """set_group with force sends a command even if nothing would change."""
+    domain, service, data = COMMANDS["set_group"]
+    data = {**data, "force": True}
+    await hass.services.async_call(domain, service, data, blocking=True)
+    _coordinator(hass, init_integration).client.requests.clear()
+
+    await hass.services.async_call(domain, service, data, blocking=True)
+    assert _requests(hass, init_integration) == Counter(WRITE)